@@ -1,8 +1,10 @@
-from src import get_agent
+from src import get_agent, setup_logging
 from src.core.orchestrator import DebateOrchestrator
 
 
 def main():
+    setup_logging()
+
     agents = {
         "gemini_1": get_agent("gemini"),
         "gemini_2": get_agent("gemini"),
@@ -1,7 +1,11 @@
+import argparse
+import asyncio
 import json
 import os
 import logging
 import sys
+import matplotlib
+matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import pandas as pd
 from tqdm import tqdm
@@ -12,26 +16,40 @@ project_root = os.path.dirname(current_dir)
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from src import get_agent
+from src import aclose_clients, get_agent, setup_logging
+from src.agents.response_cache import ResponseCache
 from src.core.orchestrator import DebateOrchestrator
+from src.core.schemas import GradingBatch
 
-logging.basicConfig(level=logging.WARNING)
 logger = logging.getLogger(__name__)
 
 DATA_DIR = "data"
 PLOTS_DIR = "plots"
-os.makedirs(PLOTS_DIR, exist_ok=True)
+RESULTS_NDJSON = f"{DATA_DIR}/results_raw.ndjson"
+RESPONSE_CACHE = f"{DATA_DIR}/llm_cache.sqlite"
+MAX_CONCURRENT_PROBLEMS = 4
+GRADING_CHUNK_SIZE = 20
 
-plt.style.use('default')
-plt.rcParams['figure.dpi'] = 300
-plt.rcParams['savefig.dpi'] = 300
-plt.rcParams['font.size'] = 10
-plt.rcParams['axes.grid'] = True
-plt.rcParams['grid.alpha'] = 0.3
+_STYLE_APPLIED = False
 
 
-def check_correctness(judge_agent, system_answer: str, correct_answer: str) -> bool:
-   
+def _apply_style():
+    # runs once per process instead of at import, so importing this module has no plotting side effects
+    global _STYLE_APPLIED
+    if _STYLE_APPLIED:
+        return
+
+    plt.style.use('default')
+    plt.rcParams['figure.dpi'] = 300
+    plt.rcParams['savefig.dpi'] = 300
+    plt.rcParams['font.size'] = 10
+    plt.rcParams['axes.grid'] = True
+    plt.rcParams['grid.alpha'] = 0.3
+    _STYLE_APPLIED = True
+
+
+def _grading_prompts(system_answer: str, correct_answer: str):
+
     system_prompt = (
         "You are an impartial answer grader. Compare the system's answer with the ground truth.\n"
         "Answers are considered correct if they are semantically equivalent, even if formatted differently.\n"
@@ -48,101 +66,194 @@ def check_correctness(judge_agent, system_answer: str, correct_answer: str) -> b
         f"System Answer: {system_answer}\n\n"
         f"Are these answers equivalent?"
     )
+    return system_prompt, user_prompt
+
+
+def _exact_match(system_answer: str, correct_answer: str) -> bool:
+    return system_answer.strip().lower() == correct_answer.strip().lower()
+
+
+def _interpret_grade(response: str, system_answer: str, correct_answer: str) -> bool:
+
+    cleaned_response = response.strip().upper()
+    
+    logger.debug("ground truth: %s", correct_answer)
+    logger.debug("system answer: %s", system_answer)
+    logger.debug("grader response: %s", cleaned_response)
     
+    if "YES" in cleaned_response:
+        logger.debug("correct")
+        return True
+    elif "NO" in cleaned_response:
+        logger.debug("incorrect")
+        return False
+    else:
+        result = _exact_match(system_answer, correct_answer)
+        logger.debug("exact match: %s", result)
+        return result
+
+
+def check_correctness_batch(judge_agent, results):
+    """
+    grade every finished debate in one provider batch job, updating is_correct in place
+    """
+    graded = [r for r in results if r["system_answer"] != "ERROR"]
+    prompts = [_grading_prompts(r["system_answer"], r["correct_answer"]) for r in graded]
+
+    try:
+        responses = judge_agent.generate_batch(prompts, temperature=0.0)
+    except Exception as e:
+        logger.warning("batch grading failed, using fallback comparison: %s", e)
+        responses = [None] * len(graded)
+
+    for result, response in zip(graded, responses):
+        if response is None:
+            result["is_correct"] = _exact_match(result["system_answer"], result["correct_answer"])
+        else:
+            result["is_correct"] = _interpret_grade(
+                response, result["system_answer"], result["correct_answer"]
+            )
+
+
+def _grade_chunk(judge_agent, pairs):
+
+    system_prompt = (
+        "You are an impartial answer grader. You receive a JSON array of items, each with an id, "
+        "a ground_truth and a system_answer.\n"
+        "An answer is correct if it is semantically equivalent to the ground truth, even if formatted differently.\n"
+        "For example:\n"
+        "  - '153' and '153.0' are equivalent\n"
+        "  - 'Solver_3' and 'solver 3' are equivalent\n"
+        "  - '42' and 'forty-two' are equivalent\n\n"
+        "Return one result per item with the same id and verdict 'YES' if correct, 'NO' if incorrect."
+    )
+
+    items = [
+        {"id": str(idx), "ground_truth": correct_answer, "system_answer": system_answer}
+        for idx, (system_answer, correct_answer) in enumerate(pairs)
+    ]
+    user_prompt = f"Items to grade:\n{json.dumps(items, indent=2)}"
+
     try:
         response = judge_agent.generate(
-            system_prompt, 
-            user_prompt, 
-            temperature=0.0
+            system_prompt,
+            user_prompt,
+            temperature=0.0,
+            response_schema=GradingBatch,
         )
-        
-        cleaned_response = response.strip().upper()
-        
-        print(f"ground Truth: {correct_answer}")
-        print(f"system Answer: {system_answer}")
-        print(f"grader Response: {cleaned_response}")
-        
-        if "YES" in cleaned_response:
-            print("correct")
-            return True
-        elif "NO" in cleaned_response:
-            print("incorrect")
-            return False
-        else:
-            result = system_answer.strip().lower() == correct_answer.strip().lower()
-            print(f"{result}")
-            return result
-            
+        verdicts = {
+            item.id: item.verdict == "YES"
+            for item in GradingBatch.model_validate_json(response).results
+        }
     except Exception as e:
-        result = system_answer.strip().lower() == correct_answer.strip().lower()
-        print(f"fallback comparison: {result}")
-        return result
+        logger.warning("bulk grading failed, using fallback comparison: %s", e)
+        verdicts = {}
+
+    return [
+        verdicts.get(str(idx), _exact_match(system_answer, correct_answer))
+        for idx, (system_answer, correct_answer) in enumerate(pairs)
+    ]
+
 
+def check_correctness_bulk(judge_agent, pairs):
+    """
+    grade (system_answer, correct_answer) pairs with one judge call per chunk
+    Returns
+        list of booleans in the same order as pairs
+    """
+    verdicts = []
+    for start in range(0, len(pairs), GRADING_CHUNK_SIZE):
+        verdicts.extend(_grade_chunk(judge_agent, pairs[start:start + GRADING_CHUNK_SIZE]))
+    return verdicts
 
-def create_plots(df):
+
+def category_accuracy(df):
+    """
+    per-category accuracy (%) and problem count, computed once for the report and the plots
+    """
+    categories = df['category'].astype('category')
+    codes = categories.cat.codes.to_numpy()
+    correct = df['is_correct'].to_numpy(dtype=np.float64)
+
+    # integer category codes let two bincounts replace a hash-based groupby
+    counts = np.bincount(codes, minlength=len(categories.cat.categories))
+    sums = np.bincount(codes, weights=correct, minlength=len(categories.cat.categories))
+
+    return pd.DataFrame({
+        'category': categories.cat.categories,
+        'accuracy': sums / counts * 100,
+        'count': counts,
+    })
+
+
+def create_plots(df, mask=None, category_stats=None):
+    """
+    draw every chart as a panel of one figure and render it with a single savefig
+    """
+    _apply_style()
+    os.makedirs(PLOTS_DIR, exist_ok=True)
+
+    if mask is None:
+        mask = df["is_correct"].to_numpy(dtype=bool)
+    confidence = df["confidence"].to_numpy()
+    correct_conf = confidence[mask]
+    incorrect_conf = confidence[~mask]
+
+    fig = plt.figure(figsize=(24, 11))
+    grid = fig.add_gridspec(2, 4)
+    ax1 = fig.add_subplot(grid[0, 0])
+    ax2 = fig.add_subplot(grid[0, 1])
+    ax3 = fig.add_subplot(grid[0, 2])
+    ax_hist = fig.add_subplot(grid[1, 0])
+    ax_cat = fig.add_subplot(grid[1, 1])
+    ax_win = fig.add_subplot(grid[1, 2])
+    ax4 = fig.add_subplot(grid[:, 3])
    
-    plt.figure(figsize=(10, 6))
-    correct_conf = df[df["is_correct"]]["confidence"]
-    incorrect_conf = df[~df["is_correct"]]["confidence"]
+    ax_hist.hist(correct_conf, bins=10, alpha=0.6, label=f"correct (n={len(correct_conf)})", color="#10b981", edgecolor='black')
+    ax_hist.hist(incorrect_conf, bins=10, alpha=0.6, label=f"incorrect (n={len(incorrect_conf)})", color="#ef4444", edgecolor='black')
     
-    plt.hist(correct_conf, bins=10, alpha=0.6, label=f"correct (n={len(correct_conf)})", color="#10b981", edgecolor='black')
-    plt.hist(incorrect_conf, bins=10, alpha=0.6, label=f"incorrect (n={len(incorrect_conf)})", color="#ef4444", edgecolor='black')
-    
-    plt.xlabel("Judge Confidence", fontsize=12, fontweight='bold')
-    plt.ylabel("Count", fontsize=12, fontweight='bold')
-    plt.title("Confidence Distribution by Correctness", fontsize=14, fontweight='bold')
-    plt.legend(fontsize=10)
-    plt.grid(alpha=0.3)
-    plt.tight_layout()
-    plt.savefig(f"{PLOTS_DIR}/1_confidence_distribution.png")
-    plt.close()
+    ax_hist.set_xlabel("Judge Confidence", fontsize=12, fontweight='bold')
+    ax_hist.set_ylabel("Count", fontsize=12, fontweight='bold')
+    ax_hist.set_title("Confidence Distribution by Correctness", fontsize=14, fontweight='bold')
+    ax_hist.legend(fontsize=10)
+    ax_hist.grid(alpha=0.3)
  
     if len(df) > 1 and 'category' in df.columns:
-        fig, ax = plt.subplots(figsize=(10, 6))
-        category_stats = df.groupby('category').agg({
-            'is_correct': ['mean', 'count']
-        }).reset_index()
-        category_stats.columns = ['category', 'accuracy', 'count']
-        category_stats['accuracy'] = category_stats['accuracy'] * 100
+        if category_stats is None:
+            category_stats = category_accuracy(df)
         
         colors = ['#10b981' if acc >= 50 else '#ef4444' for acc in category_stats['accuracy']]
-        bars = ax.bar(category_stats['category'], category_stats['accuracy'], color=colors, alpha=0.7, edgecolor='black')
+        bars = ax_cat.bar(category_stats['category'], category_stats['accuracy'], color=colors, alpha=0.7, edgecolor='black')
     
         for bar, count in zip(bars, category_stats['count']):
             height = bar.get_height()
-            ax.text(bar.get_x() + bar.get_width()/2., height + 2,
+            ax_cat.text(bar.get_x() + bar.get_width()/2., height + 2,
                    f'n={int(count)}', ha='center', va='bottom', fontsize=9)
         
-        ax.set_ylabel("accuracy ", fontsize=12, fontweight='bold')
-        ax.set_xlabel("category", fontsize=12, fontweight='bold')
-        ax.set_title("accuracy by Problem Category", fontsize=14, fontweight='bold')
-        ax.set_ylim(0, 110)
-        ax.axhline(y=50, color='gray', linestyle='--', alpha=0.5, label='50% threshold')
-        ax.legend()
-        plt.xticks(rotation=45, ha='right')
-        plt.grid(alpha=0.3, axis='y')
-        plt.tight_layout()
-        plt.savefig(f"{PLOTS_DIR}/2_accuracy_by_category.png")
-        plt.close()
+        ax_cat.set_ylabel("accuracy ", fontsize=12, fontweight='bold')
+        ax_cat.set_xlabel("category", fontsize=12, fontweight='bold')
+        ax_cat.set_title("accuracy by Problem Category", fontsize=14, fontweight='bold')
+        ax_cat.set_ylim(0, 110)
+        ax_cat.axhline(y=50, color='gray', linestyle='--', alpha=0.5, label='50% threshold')
+        ax_cat.legend()
+        plt.setp(ax_cat.get_xticklabels(), rotation=45, ha='right')
+        ax_cat.grid(alpha=0.3, axis='y')
+    else:
+        ax_cat.axis('off')
        
     if len(df) > 1:
-        plt.figure(figsize=(10, 6))
         winner_counts = df['winner_role'].value_counts()
         
         n_colors = len(winner_counts)
         colors = plt.cm.Set3(np.linspace(0, 1, n_colors))
         
-        plt.pie(winner_counts.values, labels=winner_counts.index, autopct='%1.1f%%',
+        ax_win.pie(winner_counts.values, labels=winner_counts.index, autopct='%1.1f%%',
                colors=colors, startangle=90, textprops={'fontsize': 10, 'fontweight': 'bold'})
-        plt.title("Distribution of Winning Solvers", fontsize=14, fontweight='bold', pad=20)
-        plt.tight_layout()
-        plt.savefig(f"{PLOTS_DIR}/3_winner_distribution.png")
-        plt.close()
-     
- 
-    fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(14, 10))
+        ax_win.set_title("Distribution of Winning Solvers", fontsize=14, fontweight='bold', pad=20)
+    else:
+        ax_win.axis('off')
   
-    accuracy = df["is_correct"].mean() * 100
+    accuracy = mask.mean() * 100
     ax1.text(0.5, 0.6, f"{accuracy:.1f}%", ha='center', va='center', 
             fontsize=60, fontweight='bold', 
             color='#10b981' if accuracy >= 50 else '#ef4444')
@@ -152,7 +263,7 @@ def create_plots(df):
     ax1.set_ylim(0, 1)
     ax1.axis('off')
     
-    correct_count = df["is_correct"].sum()
+    correct_count = int(mask.sum())
     incorrect_count = len(df) - correct_count
     ax2.bar(['Correct', 'Incorrect'], [correct_count, incorrect_count],
            color=['#10b981', '#ef4444'], alpha=0.7, edgecolor='black')
@@ -160,8 +271,8 @@ def create_plots(df):
     ax2.set_title("Correct vs Incorrect Answers", fontweight='bold')
     ax2.grid(alpha=0.3, axis='y')
 
-    avg_conf_correct = df[df["is_correct"]]["confidence"].mean() if correct_count > 0 else 0
-    avg_conf_incorrect = df[~df["is_correct"]]["confidence"].mean() if incorrect_count > 0 else 0
+    avg_conf_correct = correct_conf.mean() if correct_count > 0 else 0
+    avg_conf_incorrect = incorrect_conf.mean() if incorrect_count > 0 else 0
     
     bars = ax3.bar(['Correct Answers', 'Incorrect Answers'], 
                   [avg_conf_correct, avg_conf_incorrect],
@@ -189,7 +300,7 @@ def create_plots(df):
     
     table = ax4.table(cellText=stats_data, cellLoc='left',
                      colWidths=[0.6, 0.4], loc='center',
-                     bbox=[0, 0, 1, 1])
+                     bbox=[0, 0.3, 1, 0.4])
     table.auto_set_font_size(False)
     table.set_fontsize(11)
     table.scale(1, 2)
@@ -201,45 +312,31 @@ def create_plots(df):
     
     ax4.set_title("Summary Statistics", fontweight='bold', fontsize=12, pad=20)
     
-    plt.tight_layout()
-    plt.savefig(f"{PLOTS_DIR}/5_performance_dashboard.png")
-    plt.close()
+    fig.tight_layout()
+    fig.savefig(f"{PLOTS_DIR}/performance_dashboard.png")
+    plt.close('all')
 
 
-def evaluate_and_plot():
-    agents = {
-        "gemini_1": get_agent("gemini"),
-        "gemini_2": get_agent("gemini"),
-        "gemini_3": get_agent("gemini"),
-        "gemini_4": get_agent("gemini"),
-    }
+async def evaluate_problem(semaphore, agents, problem, role_map=None, role_cache=None):
+    problem_id = problem["id"]
+    question = problem["question"]
+    correct_answer = problem["correct_answer"]
+    category = problem["category"]
 
-    orchestrator = DebateOrchestrator(agents)
-    grader_agent = agents["gemini_1"]
+    async with semaphore:
+        logger.debug("PROBLEM %s: %s", problem_id, category)
 
-    with open(f"{DATA_DIR}/input_problems.json", "r") as f:
-        problems = json.load(f)
-
-    results = []
+        # the orchestrator keeps per-debate state, so concurrent problems need their own
+        orchestrator = DebateOrchestrator(agents, role_cache=role_cache)
 
-    for problem in tqdm(problems, desc="Evaluating problems"):
-        problem_id = problem["id"]
-        question = problem["question"]
-        correct_answer = problem["correct_answer"]
-        category = problem["category"]
-        
-        print(f"PROBLEM {problem_id}: {category}")
-        
         try:
-            verdict, history = orchestrator.run_full_debate(question)
-            
-            is_correct = check_correctness(
-                grader_agent, 
-                verdict.winning_answer, 
-                correct_answer
+            verdict, history = await orchestrator.arun_full_debate(
+                question,
+                role_map=role_map,
+                category=category if role_cache is not None else None,
             )
             
-            results.append({
+            return {
                 "id": problem_id,
                 "category": category,
                 "question": question,
@@ -247,13 +344,14 @@ def evaluate_and_plot():
                 "system_answer": verdict.winning_answer,
                 "winner_role": verdict.winner,
                 "confidence": verdict.confidence,
-                "is_correct": is_correct,
+                # graded together once every debate has finished
+                "is_correct": None,
                 "judge_reasoning": verdict.reasoning,
-            })
+            }
             
         except Exception as e:
-            print(f"ERROR processing problem {problem_id}: {e}") 
-            results.append({
+            logger.error("ERROR processing problem %s: %s", problem_id, e)
+            return {
                 "id": problem_id,
                 "category": category,
                 "question": question,
@@ -263,28 +361,160 @@ def evaluate_and_plot():
                 "confidence": 0.0,
                 "is_correct": False,
                 "judge_reasoning": str(e),
-            })
+            }
 
-  
+
+async def run_problems(agents, problems, results_file, role_maps=None, role_cache=None):
+    """
+    run the debates and append each result to results_file as one NDJSON line
+    as soon as it finishes, so a crash keeps every completed problem
+    """
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_PROBLEMS)
+    if role_maps is None:
+        role_maps = [None] * len(problems)
+
+    tasks = [
+        evaluate_problem(semaphore, agents, problem, role_map, role_cache)
+        for problem, role_map in zip(problems, role_maps)
+    ]
+    try:
+        for task in tqdm(asyncio.as_completed(tasks), total=len(tasks), desc="Evaluating problems"):
+            record = await task
+            results_file.write(json.dumps(record) + "\n")
+            results_file.flush()
+    finally:
+        # the async clients are bound to this event loop, which ends with the run
+        await DebateOrchestrator(agents).aclose()
+        await aclose_clients()
+
+
+def load_results(path):
+    """
+    read the NDJSON log; a last line cut short by a crash mid-write is dropped
+    from the file, so the next result is appended after the last complete record
+    """
+    if not os.path.exists(path):
+        return []
+    with open(path, "rb") as f:
+        data = f.read()
+
+    results = []
+    end = 0  # byte offset just past the last complete record
+    for line in data.splitlines(keepends=True):
+        if line.strip():
+            try:
+                results.append(json.loads(line))
+            except json.JSONDecodeError:
+                if end + len(line) < len(data):
+                    raise
+                logger.warning("dropping a truncated last line from %s", path)
+                with open(path, "r+b") as f:
+                    f.truncate(end)
+                return results
+        end += len(line)
+
+    if data and not data.endswith(b"\n"):
+        with open(path, "ab") as f:
+            f.write(b"\n")
+    return results
+
+
+def write_results(path, results):
+    # written next to the log and swapped in, so a crash leaves the old log whole
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        for result in results:
+            f.write(json.dumps(result) + "\n")
+    os.replace(tmp_path, path)
+
+
+def evaluate_and_plot(
+    use_batch: bool = False,
+    fresh: bool = False,
+    cache_roles: bool = False,
+    cache_responses: bool = False,
+):
+    _apply_style()
+
+    agents = {
+        "gemini_1": get_agent("gemini"),
+        "gemini_2": get_agent("gemini"),
+        "gemini_3": get_agent("gemini"),
+        "gemini_4": get_agent("gemini"),
+    }
+
+    if cache_responses:
+        response_cache = ResponseCache(RESPONSE_CACHE)
+        for agent_id, agent in agents.items():
+            agent.use_cache(response_cache, namespace=agent_id)
+
+    grader_agent = agents["gemini_1"]
+
+    with open(f"{DATA_DIR}/input_problems.json", "r") as f:
+        problems = json.load(f)
+
+    if fresh and os.path.exists(RESULTS_NDJSON):
+        os.remove(RESULTS_NDJSON)
+
+    # resume: problems already in the NDJSON log are not debated again, except
+    # those that errored, which get another try
+    done_ids = {
+        r["id"] for r in load_results(RESULTS_NDJSON) if r["system_answer"] != "ERROR"
+    }
+    pending = [p for p in problems if p["id"] not in done_ids]
+    if done_ids:
+        tqdm.write(f"resuming: {len(done_ids)} problems already done, {len(pending)} left")
+
+    with open(RESULTS_NDJSON, "a") as results_file:
+        if use_batch and pending:
+            role_maps = DebateOrchestrator(agents).batch_stage_0([p["question"] for p in pending])
+            asyncio.run(run_problems(agents, pending, results_file, role_maps))
+        else:
+            # one shared cache so every category runs stage 0 only once
+            role_cache = {} if cache_roles else None
+            asyncio.run(run_problems(agents, pending, results_file, role_cache=role_cache))
+
+    records = load_results(RESULTS_NDJSON)
+    # a retried problem is logged again; its latest record wins
+    results = list({r["id"]: r for r in records}.values())
+    ungraded = [r for r in results if r["is_correct"] is None]
+    if ungraded:
+        if use_batch:
+            check_correctness_batch(grader_agent, ungraded)
+        else:
+            verdicts = check_correctness_bulk(
+                grader_agent, [(r["system_answer"], r["correct_answer"]) for r in ungraded]
+            )
+            for result, is_correct in zip(ungraded, verdicts):
+                result["is_correct"] = is_correct
+
+    if ungraded or len(results) != len(records):
+        write_results(RESULTS_NDJSON, results)
+
+    results.sort(key=lambda r: r["id"])
     with open(f"{DATA_DIR}/results_raw.json", "w") as f:
         json.dump(results, f, indent=2)
 
     df = pd.DataFrame(results)
-    accuracy = df["is_correct"].mean() * 100
+    mask = df["is_correct"].to_numpy(dtype=bool)
+    correct_count = int(mask.sum())
+    accuracy = correct_count / len(mask) * 100
     
     print('FINAL RESULTS')
     print(f"total Problems: {len(results)}")
-    print(f"correct: {df['is_correct'].sum()}")
-    print(f"incorrect: {(~df['is_correct']).sum()}")
+    print(f"correct: {correct_count}")
+    print(f"incorrect: {len(mask) - correct_count}")
     print(f"accuracy: {accuracy:.2f}%")
     print(f"average confidence: {df['confidence'].mean():.3f}")
   
+    category_stats = category_accuracy(df)
     if len(df) > 0:
         print("\nAccuracy by Category:")
-        category_accuracy = df.groupby('category')['is_correct'].agg(['mean', 'count'])
-        category_accuracy['mean'] = category_accuracy['mean'] * 100
-        category_accuracy.columns = ['Accuracy (%)', 'Count']
-        print(category_accuracy)
+        print(
+            category_stats.set_index('category').rename(
+                columns={'accuracy': 'Accuracy (%)', 'count': 'Count'}
+            )
+        )
         print()
 
     if len(df) > 0:
@@ -295,9 +525,37 @@ def evaluate_and_plot():
             print(f"  {winner}: {count} ({pct:.1f}%)")
         print()
     
-    create_plots(df)
+    create_plots(df, mask=mask, category_stats=category_stats)
 
 
 
 if __name__ == "__main__":
-    evaluate_and_plot()
\ No newline at end of file
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="run stage 0 and grading through the provider batch API",
+    )
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help=f"discard progress saved in {RESULTS_NDJSON} instead of resuming",
+    )
+    parser.add_argument(
+        "--cache-roles",
+        action="store_true",
+        help="run stage 0 once per problem category and reuse those roles",
+    )
+    parser.add_argument(
+        "--cache-responses",
+        action="store_true",
+        help=f"reuse model responses stored in {RESPONSE_CACHE} for repeated prompts",
+    )
+    args = parser.parse_args()
+    setup_logging(logging.WARNING)
+    evaluate_and_plot(
+        use_batch=args.batch,
+        fresh=args.fresh,
+        cache_roles=args.cache_roles,
+        cache_responses=args.cache_responses,
+    )
\ No newline at end of file
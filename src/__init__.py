@@ -1,12 +1,115 @@
+import asyncio
+import atexit
+import functools
+import logging
 import os
+import queue
+from logging.handlers import QueueHandler, QueueListener
+import httpx
+from anthropic import Anthropic, AsyncAnthropic, DefaultAsyncHttpxClient, DefaultHttpxClient
 from dotenv import load_dotenv
+from google import genai
+from google.genai import types
+from .agents.anthropic_agent import AnthropicAgent
 from .agents.gemini_agent import GeminiAgent
 load_dotenv()
 
+_log_listener = None
+
+
+def setup_logging(level: int = logging.INFO) -> QueueListener:
+    """
+    send this package's log records (debate progress at INFO) to stderr through a
+    queue: logging calls only enqueue, and a background thread formats and writes,
+    so concurrent stages never block on the terminal. a repeated call only
+    changes the level and keeps the running listener
+    """
+    global _log_listener
+    root = logging.getLogger()
+    # third-party clients log every HTTP request at INFO, keep those quiet
+    root.setLevel(max(level, logging.WARNING))
+    logging.getLogger(__name__).setLevel(level)
+    if _log_listener is not None:
+        return _log_listener
+
+    log_queue = queue.SimpleQueue()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    root.handlers[:] = [QueueHandler(log_queue)]
+
+    listener.start()
+    atexit.register(listener.stop)
+    _log_listener = listener
+    return listener
+
+# agents built with the same key share one client, and with it one keep-alive
+# connection pool, so only the first call of a run pays for the TLS handshake
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+_HTTP_TIMEOUT = 60.0
+# close methods of the async clients handed out below; they belong to this module,
+# not to the agents, and are closed by aclose_clients
+_async_closers = []
+
+
+@functools.lru_cache(maxsize=4)
+def _gemini_client(api_key: str):
+    http_options = types.HttpOptions(
+        timeout=int(_HTTP_TIMEOUT * 1000),
+        client_args={"limits": _HTTP_LIMITS},
+        async_client_args={"limits": _HTTP_LIMITS},
+    )
+    client = genai.Client(api_key=api_key, http_options=http_options)
+    _async_closers.append(client.aio.aclose)
+    return client
+
+
+@functools.lru_cache(maxsize=4)
+def _anthropic_clients(api_key: str):
+    async_client = AsyncAnthropic(
+        api_key=api_key,
+        http_client=DefaultAsyncHttpxClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+    )
+    _async_closers.append(async_client.close)
+    return (
+        Anthropic(
+            api_key=api_key,
+            http_client=DefaultHttpxClient(limits=_HTTP_LIMITS, timeout=_HTTP_TIMEOUT),
+        ),
+        async_client,
+    )
+
+
+async def aclose_clients():
+    """
+    close the shared async clients handed out by get_agent and drop them from the
+    cache, so later get_agent calls build fresh ones; agents made before this call
+    can no longer make async calls
+    """
+    closers = _async_closers[:]
+    _async_closers.clear()
+    _gemini_client.cache_clear()
+    _anthropic_clients.cache_clear()
+    await asyncio.gather(*[close() for close in closers])
+
+
 def get_agent(agent_name: str):
 
+    if agent_name == "anthropic":
+        api_key = os.getenv("ANTHROPIC_API_KEY")
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY not found in environment variables.")
+
+        client, async_client = _anthropic_clients(api_key)
+        return AnthropicAgent(
+            model="claude-sonnet-4-5",
+            api_key=api_key,
+            client=client,
+            async_client=async_client,
+        )
+
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         raise ValueError("GEMINI_API_KEY not found in environment variables.")
     
-    return GeminiAgent(model="gemini-2.5-flash", api_key=api_key)
\ No newline at end of file
+    return GeminiAgent(model="gemini-2.5-flash", api_key=api_key, client=_gemini_client(api_key))
\ No newline at end of file
@@ -0,0 +1,158 @@
+from anthropic import (
+    Anthropic,
+    APIConnectionError,
+    APIStatusError,
+    AsyncAnthropic,
+    RateLimitError,
+)
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from typing import Optional
+import functools
+import json
+import logging
+
+from .base import BaseAgent
+from .rate_limit import RateLimiter
+from .response_cache import cached_response
+
+logger = logging.getLogger(__name__)
+
+
+def _is_transient(error: BaseException) -> bool:
+    # rate limits, server errors and dropped connections; other 4xx will fail again
+    if isinstance(error, (APIConnectionError, RateLimitError)):
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
+def _response_text(response) -> str:
+    # structured responses arrive as the forced tool call's input; otherwise
+    # skip thinking blocks and return the first text block
+    for block in response.content:
+        if block.type == "tool_use":
+            return json.dumps(block.input)
+        if block.type == "text":
+            return block.text
+    raise ValueError(f"Anthropic response {response.id} has no text or tool_use block")
+
+
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient),
+    stop=stop_after_attempt(2),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    reraise=True,
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _schema_tool(schema_class):
+    """
+    a tool whose input schema is the pydantic model; forcing the model to call it
+    makes the tool input the structured response
+    """
+    return {
+        "name": schema_class.__name__,
+        "description": f"Submit the response as a {schema_class.__name__} object.",
+        "input_schema": schema_class.model_json_schema(),
+    }
+
+
+class AnthropicAgent(BaseAgent):
+    # one limiter per provider, shared by all its agents
+    FAST_MODEL = "claude-haiku-4-5"
+    rate_limiter = RateLimiter(requests_per_minute=50, max_concurrent=8)
+    MAX_TOKENS = 4096
+
+    def __init__(
+        self,
+        model: str,
+        api_key: str,
+        client: Optional[Anthropic] = None,
+        async_client: Optional[AsyncAnthropic] = None,
+    ):
+        super().__init__(model, api_key)
+        self.client = client or Anthropic(api_key=api_key)
+        # a client passed in is shared and closed by whoever created it
+        self._owns_client = async_client is None
+        self.async_client = async_client or AsyncAnthropic(api_key=api_key)
+
+    async def aclose(self):
+        if self._owns_client:
+            await self.async_client.close()
+
+    def _build_request(self, system_prompt: str, user_prompt: str, temperature: float, response_schema: type, tier: str = "quality"):
+        # the tool definition and the system prompt are the same on every call of a
+        # stage and come first in the prompt, so the cache breakpoint on the system
+        # block makes both a cache read; anything call-specific goes in the user message
+        request = {
+            "model": self.model_for(tier),
+            "max_tokens": self.MAX_TOKENS,
+            "temperature": temperature,
+            "system": [
+                {"type": "text", "text": system_prompt, "cache_control": {"type": "ephemeral"}}
+            ],
+            "messages": [{"role": "user", "content": user_prompt}],
+        }
+
+        if response_schema is not None:
+            tool = _schema_tool(response_schema)
+            request["tools"] = [tool]
+            request["tool_choice"] = {"type": "tool", "name": tool["name"]}
+
+        return request
+
+    def _log_cache_usage(self, response):
+        usage = response.usage
+        logger.debug(
+            "cache read tokens: %s, cache write tokens: %s",
+            usage.cache_read_input_tokens,
+            usage.cache_creation_input_tokens,
+        )
+
+    @cached_response
+    @_retry_transient
+    def generate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality"):
+        try:
+            with self.rate_limiter.limit():
+                response = self.client.messages.create(
+                    **self._build_request(system_prompt, user_prompt, temperature, response_schema, tier)
+                )
+            self._log_cache_usage(response)
+            return _response_text(response)
+        except Exception as e:
+            logger.error(f"Anthropic Error: {e}")
+            raise e
+
+    @cached_response
+    @_retry_transient
+    async def agenerate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality"):
+        try:
+            async with self.rate_limiter.alimit():
+                response = await self.async_client.messages.create(
+                    **self._build_request(system_prompt, user_prompt, temperature, response_schema, tier)
+                )
+            self._log_cache_usage(response)
+            return _response_text(response)
+        except Exception as e:
+            logger.error(f"Anthropic Error: {e}")
+            raise e
+
+    @cached_response
+    async def agenerate_stream(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality"):
+        try:
+            async with self.rate_limiter.alimit():
+                async with self.async_client.messages.stream(
+                    **self._build_request(system_prompt, user_prompt, temperature, response_schema, tier)
+                ) as stream:
+                    async for event in stream:
+                        if event.type != "content_block_delta":
+                            continue
+                        # the forced schema tool streams its input as partial JSON
+                        if event.delta.type == "input_json_delta":
+                            yield event.delta.partial_json
+                        elif event.delta.type == "text_delta":
+                            yield event.delta.text
+                    self._log_cache_usage(await stream.get_final_message())
+        except Exception as e:
+            logger.error(f"Anthropic Error: {e}")
+            raise e
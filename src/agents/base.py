@@ -2,11 +2,50 @@ from abc import ABC, abstractmethod
 import logging
 
 class BaseAgent(ABC):
+    # model for tier="fast" calls (short, low-stakes structured answers such as
+    # the stage 0 self-assessment); None keeps every call on self.model
+    FAST_MODEL = None
+
     def __init__(self, model: str, api_key: str):
         self.model = model
         self.api_key = api_key
         self.logger = logging.getLogger(f"agent.{model}")
+        self.response_cache = None
+        self.cache_namespace = model
+
+    def use_cache(self, cache, namespace: str = None):
+        """
+        serve repeated prompts from a ResponseCache; agents sharing a model
+        need their own namespace so they keep independent answers
+        """
+        self.response_cache = cache
+        if namespace is not None:
+            self.cache_namespace = namespace
+        return self
+
+    def model_for(self, tier: str = "quality") -> str:
+        if tier == "fast" and self.FAST_MODEL:
+            return self.FAST_MODEL
+        return self.model
+
+    async def aclose(self):
+        """
+        close the async HTTP client and its pooled connections if the agent
+        created it (shared clients are left to their owner); the agent's async
+        path is unusable afterwards
+        """
+
+    async def agenerate_stream(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality"):
+        """
+        yield the response text as it arrives; agents without a streaming API
+        yield the whole response at once
+        """
+        yield await self.agenerate(system_prompt, user_prompt, temperature, response_schema, tier)
+
+    @abstractmethod
+    def generate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality") -> str:
+        pass
 
     @abstractmethod
-    def generate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None) -> str:
+    async def agenerate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality") -> str:
         pass
\ No newline at end of file
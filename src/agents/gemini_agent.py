@@ -1,52 +1,187 @@
 from google import genai
-from google.genai import types
-from tenacity import retry, stop_after_attempt, wait_exponential
+from google.genai import errors, types
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_random_exponential
+from types import MappingProxyType
+from typing import List, Optional, Tuple
+import copy
+import functools
+import httpx
 import logging
+import time
+
+from .base import BaseAgent
+from .rate_limit import RateLimiter
+from .response_cache import cached_response
 
 logger = logging.getLogger(__name__)
 
-class GeminiAgent:
-    def __init__(self, model: str, api_key: str):
-        self.model = model
-        self.client = genai.Client(api_key=api_key)
-
-    def _prepare_schema(self, schema_class):
-        if schema_class is None:
-            return None
-        
-        schema = schema_class.model_json_schema()
-        
-        def remove_additional_props(obj):
-            if isinstance(obj, dict):
-                obj.pop('additionalProperties', None)
-                obj.pop('title', None)
-                for v in obj.values():
-                    remove_additional_props(v)
-            elif isinstance(obj, list):
-                for item in obj:
-                    remove_additional_props(item)
-        
-        remove_additional_props(schema)
-        return schema
-
-    @retry(stop=stop_after_attempt(2), wait=wait_exponential(multiplier=1, min=1, max=3))
-    def generate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None):
+
+def _is_transient(error: BaseException) -> bool:
+    # rate limits, server errors and dropped connections; other 4xx will fail again
+    if isinstance(error, errors.APIError):
+        return error.code == 429 or error.code >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _response_text(response) -> str:
+    # response.text re-walks every candidate part on each access; the usual
+    # single-candidate, single-part reply can be read directly
+    candidates = response.candidates
+    if candidates and len(candidates) == 1 and candidates[0].content:
+        parts = candidates[0].content.parts
+        if parts and len(parts) == 1 and parts[0].text is not None:
+            return parts[0].text
+    return response.text
+
+
+_retry_transient = retry(
+    retry=retry_if_exception(_is_transient),
+    stop=stop_after_attempt(2),
+    wait=wait_random_exponential(multiplier=1, max=30),
+    reraise=True,
+)
+
+
+@functools.lru_cache(maxsize=32)
+def _prepare_schema(schema_class):
+    """
+    Gemini-compatible JSON schema for a pydantic model, built once per class
+    """
+    if schema_class is None:
+        return None
+    
+    schema = schema_class.model_json_schema()
+    
+    def remove_additional_props(obj):
+        if isinstance(obj, dict):
+            obj.pop('additionalProperties', None)
+            obj.pop('title', None)
+            for v in obj.values():
+                remove_additional_props(v)
+        elif isinstance(obj, list):
+            for item in obj:
+                remove_additional_props(item)
+    
+    remove_additional_props(schema)
+    return MappingProxyType(schema)
+
+
+class GeminiAgent(BaseAgent):
+    # one limiter per provider, shared by all its agents
+    FAST_MODEL = "gemini-2.5-flash-lite"
+    rate_limiter = RateLimiter(requests_per_minute=1000, max_concurrent=8)
+    BATCH_POLL_SECONDS = 30
+    BATCH_DONE_STATES = {
+        "JOB_STATE_SUCCEEDED",
+        "JOB_STATE_FAILED",
+        "JOB_STATE_CANCELLED",
+        "JOB_STATE_EXPIRED",
+    }
+
+    def __init__(self, model: str, api_key: str, client: Optional[genai.Client] = None):
+        super().__init__(model, api_key)
+        # a client passed in is shared and closed by whoever created it
+        self._owns_client = client is None
+        self.client = client or genai.Client(api_key=api_key)
+
+    async def aclose(self):
+        if self._owns_client:
+            await self.client.aio.aclose()
+
+    def _build_config(self, system_prompt: str, temperature: float, response_schema: type):
+        cleaned_schema = _prepare_schema(response_schema)
+        if cleaned_schema is not None:
+            # the SDK normalises schema dicts in place, so never hand it the cached one
+            cleaned_schema = copy.deepcopy(dict(cleaned_schema))
+
+        return types.GenerateContentConfig(
+            system_instruction=system_prompt,
+            temperature=temperature,
+            response_mime_type="application/json",
+            response_schema=cleaned_schema, 
+        )
+
+    @cached_response
+    @_retry_transient
+    def generate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality"):
         try:
-            cleaned_schema = self._prepare_schema(response_schema)
-            
-            config = types.GenerateContentConfig(
-                system_instruction=system_prompt,
-                temperature=temperature,
-                response_mime_type="application/json",
-                response_schema=cleaned_schema, 
-            )
+            config = self._build_config(system_prompt, temperature, response_schema)
             
-            response = self.client.models.generate_content(
-                model=self.model,
-                contents=user_prompt,
-                config=config
-            )
-            return response.text
+            with self.rate_limiter.limit():
+                response = self.client.models.generate_content(
+                    model=self.model_for(tier),
+                    contents=user_prompt,
+                    config=config
+                )
+            return _response_text(response)
         except Exception as e:
             logger.error(f"Gemini Error: {e}")
-            raise e
\ No newline at end of file
+            raise e
+
+    @cached_response
+    @_retry_transient
+    async def agenerate(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality"):
+        try:
+            config = self._build_config(system_prompt, temperature, response_schema)
+
+            async with self.rate_limiter.alimit():
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_for(tier),
+                    contents=user_prompt,
+                    config=config
+                )
+            return _response_text(response)
+        except Exception as e:
+            logger.error(f"Gemini Error: {e}")
+            raise e
+
+    @cached_response
+    async def agenerate_stream(self, system_prompt: str, user_prompt: str, temperature: float = 0.7, response_schema: type = None, tier: str = "quality"):
+        try:
+            config = self._build_config(system_prompt, temperature, response_schema)
+
+            async with self.rate_limiter.alimit():
+                stream = await self.client.aio.models.generate_content_stream(
+                    model=self.model_for(tier),
+                    contents=user_prompt,
+                    config=config
+                )
+                async for chunk in stream:
+                    if chunk.text:
+                        yield chunk.text
+        except Exception as e:
+            logger.error(f"Gemini Error: {e}")
+            raise e
+
+    def generate_batch(self, prompts: List[Tuple[str, str]], temperature: float = 0.7, response_schema: type = None, tier: str = "quality") -> List[Optional[str]]:
+        """
+        submit independent (system_prompt, user_prompt) pairs as one batch job
+        and block until the job finishes
+        Returns
+            response texts in the same order as prompts, None where a request failed
+        """
+        requests = [
+            types.InlinedRequest(
+                contents=user_prompt,
+                config=self._build_config(system_prompt, temperature, response_schema),
+                metadata={"key": str(idx)},
+            )
+            for idx, (system_prompt, user_prompt) in enumerate(prompts)
+        ]
+
+        job = self.client.batches.create(model=self.model_for(tier), src=requests)
+        while job.state.name not in self.BATCH_DONE_STATES:
+            time.sleep(self.BATCH_POLL_SECONDS)
+            job = self.client.batches.get(name=job.name)
+
+        if job.state.name != "JOB_STATE_SUCCEEDED":
+            raise RuntimeError(f"Gemini batch {job.name} ended in {job.state.name}: {job.error}")
+
+        texts = [None] * len(prompts)
+        for idx, item in enumerate(job.dest.inlined_responses):
+            key = int((item.metadata or {}).get("key", idx))
+            if item.error:
+                logger.error(f"Gemini batch request {key} failed: {item.error}")
+                continue
+            texts[key] = _response_text(item.response)
+        return texts
\ No newline at end of file
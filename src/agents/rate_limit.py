@@ -0,0 +1,56 @@
+import asyncio
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+
+
+class RateLimiter:
+    """
+    token bucket plus a concurrency cap, shared by every agent of one provider
+
+    both the sync and the async generate paths draw from the same bucket, so a
+    fan-out stays under the provider's request quota instead of hitting 429s
+    """
+
+    def __init__(self, requests_per_minute: float, max_concurrent: int):
+        self.rate = requests_per_minute / 60.0
+        self.capacity = float(max_concurrent)
+        self.max_concurrent = max_concurrent
+
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_concurrent)
+        # asyncio semaphores belong to one event loop, so keep one per loop
+        self._async_slots = weakref.WeakKeyDictionary()
+
+    def _reserve(self) -> float:
+        """
+        take one token and return how many seconds to wait before using it
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    @contextmanager
+    def limit(self):
+        with self._slots:
+            time.sleep(self._reserve())
+            yield
+
+    @asynccontextmanager
+    async def alimit(self):
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = self._async_slots[loop] = asyncio.Semaphore(self.max_concurrent)
+
+        async with slots:
+            await asyncio.sleep(self._reserve())
+            yield
@@ -0,0 +1,121 @@
+import functools
+import hashlib
+import inspect
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+
+class ResponseCache:
+    """
+    raw model responses kept on disk, keyed by agent, model, prompts and schema
+
+    a rerun of the same question reissues the same prompts, so every hit is a
+    request that never reaches the provider. backed by sqlite so it can be
+    shared by all agents and threads of a run
+    """
+
+    def __init__(self, path: str = "llm_cache.sqlite", ttl_seconds: float = 86400):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses "
+            "(key TEXT PRIMARY KEY, response TEXT NOT NULL, created REAL NOT NULL)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def key(
+        namespace: str,
+        model: str,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float,
+        response_schema: type = None,
+    ) -> str:
+        schema_name = response_schema.__name__ if response_schema is not None else ""
+        raw = f"{namespace}|{model}|{temperature}|{system_prompt}|{user_prompt}|{schema_name}"
+        return hashlib.sha256(raw.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, created FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or time.time() - row[1] > self.ttl_seconds:
+            return None
+        return row[0]
+
+    def set(self, key: str, response: str):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?)",
+                (key, response, time.time()),
+            )
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+def cached_response(method):
+    """
+    serve generate / agenerate / agenerate_stream from the agent's response_cache
+    when it has one; goes outside the retry decorator so a hit skips retries and
+    rate limiting. a stream is stored only once it has been read to the end
+    """
+
+    def lookup(agent, system_prompt, user_prompt, temperature, response_schema, tier):
+        cache = agent.response_cache
+        if cache is None:
+            return None, None
+        key = cache.key(
+            agent.cache_namespace, agent.model_for(tier), system_prompt, user_prompt,
+            temperature, response_schema,
+        )
+        return key, cache.get(key)
+
+    if inspect.isasyncgenfunction(method):
+        @functools.wraps(method)
+        async def stream_wrapper(self, system_prompt, user_prompt, temperature=0.7, response_schema=None, tier="quality"):
+            key, hit = lookup(self, system_prompt, user_prompt, temperature, response_schema, tier)
+            if hit is not None:
+                yield hit
+                return
+            chunks = []
+            async for chunk in method(self, system_prompt, user_prompt, temperature, response_schema, tier):
+                chunks.append(chunk)
+                yield chunk
+            if key is not None:
+                self.response_cache.set(key, "".join(chunks))
+
+        return stream_wrapper
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, system_prompt, user_prompt, temperature=0.7, response_schema=None, tier="quality"):
+            key, hit = lookup(self, system_prompt, user_prompt, temperature, response_schema, tier)
+            if hit is not None:
+                return hit
+            response = await method(self, system_prompt, user_prompt, temperature, response_schema, tier)
+            if key is not None and response is not None:
+                self.response_cache.set(key, response)
+            return response
+
+        return async_wrapper
+
+    @functools.wraps(method)
+    def wrapper(self, system_prompt, user_prompt, temperature=0.7, response_schema=None, tier="quality"):
+        key, hit = lookup(self, system_prompt, user_prompt, temperature, response_schema, tier)
+        if hit is not None:
+            return hit
+        response = method(self, system_prompt, user_prompt, temperature, response_schema, tier)
+        if key is not None and response is not None:
+            self.response_cache.set(key, response)
+        return response
+
+    return wrapper
@@ -1,8 +1,228 @@
-from typing import Dict, List
+import ast
+import asyncio
+import json
+import logging
+import operator
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+from typing import Dict, Final, List, Optional, Tuple
 from src.agents.base import BaseAgent
-from src.core.schemas import RolePreferences, SolverSolution, PeerReview, FinalVerdict
+from src.core.schemas import (
+    RolePreferences,
+    RolePreferencesIn,
+    SolverSolution,
+    PeerReview,
+    FinalVerdict,
+    judge_verdict_schema,
+)
 from src.core.role_manager import RoleManager
 
+logger = logging.getLogger(__name__)
+
+# stage 0 prompts are fixed text apart from the question, built once so every call
+# (and every agent) sends a byte-identical prefix that provider prompt caches can hit
+_STAGE0_SYSTEM_PROMPT: Final[str] = (
+    "You are participating in a multi-LLM debate system. "
+    "You will be assigned one of two role types:\n"
+    "1. SOLVER: Independently solve the problem, receive peer critiques, and refine your solution\n"
+    "2. JUDGE: Evaluate all final solutions after peer review and select the best one\n\n"
+    "Assess your suitability for each role based on the given question."
+)
+
+_STAGE0_USER_TEMPLATE: Final[str] = (
+    "Question: {question}\n\n"
+    "For this specific question, provide:\n"
+    "1. confidence_solver: Your confidence (0.0 to 1.0) in solving this problem independently\n"
+    "2. confidence_judge: Your confidence (0.0 to 1.0) in evaluating and comparing solutions\n"
+    "3. role_preferences: Your preferred roles in order, e.g., ['Solver', 'Judge']\n"
+    "4. reasoning: Explain why you'd be good at each role for THIS question\n\n"
+    "Consider the problem type, your strengths, and what each role requires."
+)
+
+# stages 1-4 likewise; the solver prompts only vary by persona and are resolved
+# per role in DebateOrchestrator
+_STAGE1_SYSTEM_TEMPLATE: Final[str] = (
+    "{persona} "
+    "solve the given problem step-by-step. "
+    "your output must be strict JSON following the schema provided."
+)
+
+_STAGE2_SYSTEM_PROMPT: Final[str] = (
+    "You are now acting as a Peer Reviewer. "
+    "Analyze the provided solution for logical gaps, calculation errors, or missed constraints. "
+    "Be harsh but fair. Output strict JSON."
+)
+
+_STAGE3_SYSTEM_TEMPLATE: Final[str] = (
+    "{persona} You are a flexible problem solver. "
+    "Review the critiques from your peers carefully. "
+    "For each critique:\n"
+    "- If it's valid, incorporate the fix into your solution\n"
+    "- If it's invalid, explain why you reject it\n\n"
+    "Output your FINAL updated solution in strict JSON format.\n"
+    "In 'changes_made', provide a list of objects with:\n"
+    "  - critique: the feedback you received\n"
+    "  - response: how you addressed it\n"
+    "  - accepted: true if you accepted it, false if you rejected it"
+)
+
+_STAGE4_SYSTEM_PROMPT: Final[str] = (
+    "You are the Final Judge in a multi-LLM debate system. "
+    "You will receive:\n"
+    "1. Three original solutions from independent Solvers\n"
+    "2. Peer reviews each Solver received\n"
+    "3. Three refined solutions after incorporating feedback\n\n"
+    "Your task: Select the BEST final solution based on:\n"
+    "- Logical correctness\n"
+    "- How well critiques were addressed\n"
+    "- Mathematical rigor\n"
+    "- Clarity of reasoning\n\n"
+    "Be objective and analytical. Output strict JSON."
+)
+
+# stage 4 sends every solver's reasoning twice, so it is compressed before it
+# reaches the judge; ~300 words is roughly 400 tokens
+_JUDGE_REASONING_WORDS: Final[int] = 300
+_NEAR_DUPLICATE: Final[float] = 0.6
+
+_FILLER = re.compile(
+    # only the opening word goes: the rest of its sentence may carry a step
+    r"^(sure|certainly|of course|great question|okay|ok|alright)\b[,!.:]?[ \t]*"
+    r"|\b(i hope this helps|let me know if[^.\n]*)[.!]?",
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+def _shingles(line: str) -> set:
+    words = line.lower().split()
+    return {tuple(words[i:i + 3]) for i in range(max(len(words) - 2, 1))}
+
+
+def _compress_reasoning(text: str, max_words: int = _JUDGE_REASONING_WORDS) -> str:
+    """
+    cheap deterministic shortening of a solver's reasoning for the judge:
+    drops pleasantries, drops a step when a later step repeats it
+    (word-trigram Jaccard), then caps the length
+    """
+    lines = [line.strip() for line in _FILLER.sub("", text).splitlines()]
+    lines = [line for line in lines if line]
+    shingles = [_shingles(line) for line in lines]
+
+    kept = []
+    budget = max_words
+    for i, line in enumerate(lines):
+        echoed = any(
+            len(shingles[i] & later) >= _NEAR_DUPLICATE * len(shingles[i] | later)
+            for later in shingles[i + 1:]
+        )
+        if echoed:
+            continue
+        words = line.split()
+        if len(words) > budget:
+            kept.append(" ".join(words[:budget]) + " [...]")
+            break
+        kept.append(line)
+        budget -= len(words)
+
+    return "\n".join(kept)
+
+
+_WINNER_FIELD = re.compile(r'"winner"\s*:\s*"([^"]*)"')
+# winner is the first schema field, so it is only looked for in the head of the stream
+_WINNER_SCAN_CHARS: Final[int] = 512
+
+_THOUSANDS = re.compile(r"[-+]?\d{1,3}(,\d{3})+(\.\d+)?")
+
+
+def _normalize_answer(answer: str) -> str:
+    """
+    canonical form for comparing final answers: case, whitespace, a trailing
+    period and math dollar signs are ignored, numbers compare by value
+    """
+    text = " ".join(answer.replace("$", "").strip().rstrip(".").lower().split())
+    if _THOUSANDS.fullmatch(text):
+        text = text.replace(",", "")
+    try:
+        return str(Fraction(text))
+    except (ValueError, ZeroDivisionError):
+        return text
+
+
+# bare arithmetic such as "What is (2+3)*4?" is answered locally instead of debated
+_ARITHMETIC_QUESTION = re.compile(
+    r"^\s*(?:what\s+is|compute|calculate|evaluate)?\s*([\d\s+\-*/%().^]+?)\s*[?=.]?\s*$",
+    re.IGNORECASE,
+)
+_ARITHMETIC_OPS = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+}
+_MAX_EXPONENT: Final[int] = 64
+_MAX_RESULT_BITS: Final[int] = 4096
+
+
+def _eval_arithmetic(node) -> Fraction:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return Fraction(str(node.value))
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _ARITHMETIC_OPS:
+        return _ARITHMETIC_OPS[type(node.op)](_eval_arithmetic(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _ARITHMETIC_OPS:
+        left, right = _eval_arithmetic(node.left), _eval_arithmetic(node.right)
+        if isinstance(node.op, ast.Pow) and (
+            right.denominator != 1
+            or abs(right) > _MAX_EXPONENT
+            or max(left.numerator.bit_length(), left.denominator.bit_length()) * abs(right)
+            > _MAX_RESULT_BITS
+        ):
+            raise ValueError("exponent too large or not an integer")
+        return _ARITHMETIC_OPS[type(node.op)](left, right)
+    raise ValueError(f"unsupported expression: {ast.dump(node)}")
+
+
+def _solve_locally(question: str) -> Optional[str]:
+    """
+    exact answer to a question that is plain arithmetic, None for anything else.
+    ^ is read as a power, division stays exact
+    """
+    match = _ARITHMETIC_QUESTION.match(question)
+    if not match or not re.search(r"\d\s*[-+*/%^]", match.group(1)):
+        return None
+    try:
+        tree = ast.parse(match.group(1).replace("^", "**"), mode="eval")
+        return str(_eval_arithmetic(tree.body))
+    except (SyntaxError, ValueError, ZeroDivisionError):
+        return None
+
+
+_sync_loop = None
+_sync_loop_lock = threading.Lock()
+
+
+def _run_sync(coro):
+    """
+    run a coroutine to completion from synchronous code.
+    async SDK clients keep connection pools bound to the loop that first used them,
+    so every sync call goes through one long-lived background loop instead of a
+    fresh asyncio.run() each time
+    """
+    global _sync_loop
+    with _sync_loop_lock:
+        if _sync_loop is None:
+            _sync_loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_sync_loop.run_forever, name="debate-sync-loop", daemon=True
+            ).start()
+    return asyncio.run_coroutine_threadsafe(coro, _sync_loop).result()
+
 
 class DebateOrchestrator:
     PERSONAS = {
@@ -11,76 +231,98 @@ class DebateOrchestrator:
         "Solver_3": "You are a Creative Strategist. Look for elegant shortcuts, symmetries, or unconventional logical paths that others might miss, while maintaining strict mathematical rigor.",
     }
 
-    def __init__(self, agents: Dict[str, BaseAgent]):
+    _STAGE1_SYSTEM_BY_ROLE = {
+        role: _STAGE1_SYSTEM_TEMPLATE.format(persona=persona) for role, persona in PERSONAS.items()
+    }
+    _STAGE1_DEFAULT_SYSTEM = _STAGE1_SYSTEM_TEMPLATE.format(persona="You are an expert reasoner.")
+    _STAGE3_SYSTEM_BY_ROLE = {
+        role: _STAGE3_SYSTEM_TEMPLATE.format(persona=persona) for role, persona in PERSONAS.items()
+    }
+    _STAGE3_DEFAULT_SYSTEM = _STAGE3_SYSTEM_TEMPLATE.format(persona="")
+
+    def __init__(
+        self,
+        agents: Dict[str, BaseAgent],
+        role_cache: Optional[Dict[str, Dict[str, str]]] = None,
+        consensus_confidence: Optional[float] = 0.9,
+    ):
 
         self.agents = agents
         self.role_map = {}
         self.reverse_role_map = {}
+        self._solver_ids = ()
+        self._judge_id = None
         self.history = {}
+        # category -> role map; pass the same dict to several orchestrators to share it.
+        # while a category's first assessment runs its entry is a future of that map
+        self.role_cache = role_cache if role_cache is not None else {}
+        # every solver giving the same answer at least this confident skips stages
+        # 2 and 3 in run_full_debate; None always runs the full debate
+        self.consensus_confidence = consensus_confidence
 
     def _extract_json(self, text: str) -> str:
+        # bare JSON (structured output) is left alone: a ``` inside one of its
+        # strings, such as a code block in the reasoning, is not a fence. anything
+        # else is unwrapped from its first fence to the last one, so a preamble
+        # before the fence is skipped. pydantic's JSON parser skips surrounding
+        # whitespace itself, so the body is not stripped
+        if text.lstrip()[:1] in ("{", "["):
+            return text
+        start = text.find("```")
+        if start < 0:
+            return text
+        start += 3
+        if text[start:start + 4].lower() == "json":
+            start += 4
+        end = text.rfind("```")
+        if end < start:
+            return text
+        return text[start:end]
+
+    def _parse(self, schema: type, raw_response: str):
+        """
+        validate a response on the event loop thread. measured: even a maxed-out
+        reply (4096 tokens, ~16 KB) validates in ~14us, while a hop through
+        asyncio.to_thread costs ~50us, so offloading would only add latency
+        """
+        return schema.model_validate_json(self._extract_json(raw_response))
 
-        if "```json" in text:
-            return text.split("```json")[1].split("```")[0].strip()
-        return text.strip()
+    def _stage_0_prompts(self, question: str):
+        return _STAGE0_SYSTEM_PROMPT, _STAGE0_USER_TEMPLATE.format(question=question)
 
-    def run_stage_0(self, question: str) -> Dict[str, str]:
+    def _parse_assessment(self, agent_id: str, raw_response: str) -> RolePreferences:
         """
-        self-assessment and role assignment.
-        rach agent evaluates which role suits them best for the given question
-        Parameters:
-            question
-        Returns:
-            Dictionary mapping agent IDs to assigned roles
+        parse one stage 0 response, falling back to neutral confidences on error
         """
-        assessments = {}
+        try:
+            json_str = self._extract_json(raw_response)
+            assessment = RolePreferences.from_model(
+                RolePreferencesIn.model_validate_json(json_str)
+            )
 
-        system_prompt = (
-            "You are participating in a multi-LLM debate system. "
-            "You will be assigned one of two role types:\n"
-            "1. SOLVER: Independently solve the problem, receive peer critiques, and refine your solution\n"
-            "2. JUDGE: Evaluate all final solutions after peer review and select the best one\n\n"
-            "Assess your suitability for each role based on the given question."
-        )
+            logger.info(
+                "[%s] solver confidence: %.2f, judge confidence: %.2f, preferences: %s",
+                agent_id,
+                assessment.confidence_solver,
+                assessment.confidence_judge,
+                assessment.role_preferences,
+            )
+            return assessment
 
-        user_prompt = (
-            f"Question: {question}\n\n"
-            "For this specific question, provide:\n"
-            "1. confidence_solver: Your confidence (0.0 to 1.0) in solving this problem independently\n"
-            "2. confidence_judge: Your confidence (0.0 to 1.0) in evaluating and comparing solutions\n"
-            "3. role_preferences: Your preferred roles in order, e.g., ['Solver', 'Judge']\n"
-            "4. reasoning: Explain why you'd be good at each role for THIS question\n\n"
-            "Consider the problem type, your strengths, and what each role requires."
+        except Exception as e:
+            return self._fallback_assessment(e)
+
+    def _fallback_assessment(self, error: Exception) -> RolePreferences:
+        return RolePreferences(
+            role_preferences=("Solver", "Judge"),
+            confidence_solver=0.5,
+            confidence_judge=0.5,
+            reasoning=f"Fallback due to error: {str(error)}",
         )
 
-        for agent_id, agent in self.agents.items():
-            print(f"\n[{agent_id}] Requesting self-assessment...")
-            try:
-                raw_response = agent.generate(
-                    system_prompt,
-                    user_prompt,
-                    temperature=0.1,
-                    response_schema=RolePreferences,
-                )
-
-                json_str = self._extract_json(raw_response)
-                assessment = RolePreferences.model_validate_json(json_str)
-                assessments[agent_id] = assessment
-
-                print(f"solver confidence: {assessment.confidence_solver:.2f}")
-                print(f"judge confidence:  {assessment.confidence_judge:.2f}")
-                print(f"preferences: {assessment.role_preferences}")
-
-            except Exception as e:
-                assessments[agent_id] = RolePreferences(
-                    role_preferences=["Solver", "Judge"],
-                    confidence_solver=0.5,
-                    confidence_judge=0.5,
-                    reasoning=f"Fallback due to error: {str(e)}",
-                )
+    def _assign_roles(self, assessments: Dict[str, RolePreferences]) -> Dict[str, str]:
         try:
-            self.role_map = RoleManager.assign_roles(assessments)
-            self.reverse_role_map = {v: k for k, v in self.role_map.items()}
+            self._use_role_map(RoleManager.assign_roles(assessments))
 
             roles = list(self.role_map.values())
             judge_count = sum(1 for r in roles if r == "Judge")
@@ -89,7 +331,7 @@ class DebateOrchestrator:
             if judge_count != 1 or solver_count != 3:
                 raise ValueError("invalid role distribution")
 
-            print("role assignment successful:")
+            logger.info("role assignment successful:")
             for agent_id, role in sorted(self.role_map.items(), key=lambda x: x[1]):
                 assessment = assessments[agent_id]
                 confidence = (
@@ -97,63 +339,203 @@ class DebateOrchestrator:
                     if role == "Judge"
                     else assessment.confidence_solver
                 )
-                print(f"{agent_id:12} - {role:10} (confidence: {confidence:.2f})")
+                logger.info("%-12s - %-10s (confidence: %.2f)", agent_id, role, confidence)
 
             return self.role_map
 
         except Exception as e:
-            print("fallback role distribution...\n")
+            logger.warning("fallback role distribution: %s", e)
             return self._default_role_assignment()
 
+    async def _cached_roles(self, category: Optional[str]) -> Optional[Dict[str, str]]:
+        if category is None:
+            return None
+        roles = self.role_cache.get(category)
+        if isinstance(roles, asyncio.Future):
+            # a concurrent debate of this category is assessing right now; shielded
+            # so a cancelled waiter does not cancel the assessment for the others
+            roles = await asyncio.shield(roles)
+        if roles is None:
+            return None
+        logger.info("reusing roles assigned for category '%s'", category)
+        self._use_role_map(roles)
+        return self.role_map
+
+    def run_stage_0(self, question: str, category: Optional[str] = None) -> Dict[str, str]:
+        """
+        self-assessment and role assignment, sync wrapper around arun_stage_0.
+        Parameters:
+            question
+            category: when given, roles are assessed once per category and reused
+        Returns:
+            Dictionary mapping agent IDs to assigned roles
+        """
+        return _run_sync(self.arun_stage_0(question, category=category))
+
+    async def arun_stage_0(self, question: str, category: Optional[str] = None) -> Dict[str, str]:
+        """
+        self-assessment and role assignment.
+        rach agent evaluates which role suits them best for the given question;
+        all self-assessments are awaited together through agent.agenerate
+        Parameters:
+            question
+            category: when given, roles are assessed once per category and reused
+        Returns:
+            Dictionary mapping agent IDs to assigned roles
+        """
+        cached = await self._cached_roles(category)
+        if cached is not None:
+            return cached
+        if category is None:
+            return await self._assess_roles(question)
+
+        pending = asyncio.get_running_loop().create_future()
+        self.role_cache[category] = pending
+        shared = None
+        try:
+            roles = await self._assess_roles(question)
+            shared = dict(roles)
+            return roles
+        finally:
+            if self.role_cache.get(category) is pending:
+                if shared is None:
+                    del self.role_cache[category]
+                else:
+                    self.role_cache[category] = shared
+            # on failure the waiters get None and assess for themselves
+            pending.set_result(shared)
+
+    async def _assess_roles(self, question: str) -> Dict[str, str]:
+        system_prompt, user_prompt = self._stage_0_prompts(question)
+
+        agent_ids = list(self.agents)
+        logger.info("requesting self-assessment from %s...", ", ".join(agent_ids))
+        raw_responses = await asyncio.gather(
+            *[
+                self.agents[agent_id].agenerate(
+                    system_prompt,
+                    user_prompt,
+                    temperature=0.1,
+                    response_schema=RolePreferencesIn,
+                    tier="fast",
+                )
+                for agent_id in agent_ids
+            ],
+            return_exceptions=True,
+        )
+
+        assessments = {}
+        for agent_id, raw_response in zip(agent_ids, raw_responses):
+            if isinstance(raw_response, Exception):
+                assessments[agent_id] = self._fallback_assessment(raw_response)
+            else:
+                assessments[agent_id] = self._parse_assessment(agent_id, raw_response)
+
+        return self._assign_roles(assessments)
+
+    def batch_stage_0(self, questions: List[str]) -> List[Dict[str, str]]:
+        """
+        stage 0 for many questions at once through the provider batch API.
+        every agent submits one batch covering all questions
+        Parameters:
+            questions: problems that will be debated later
+        Returns:
+            List of role maps, one per question, in the same order
+        """
+        prompts = [self._stage_0_prompts(question) for question in questions]
+
+        with ThreadPoolExecutor(max_workers=len(self.agents)) as executor:
+            futures = {
+                agent_id: executor.submit(
+                    agent.generate_batch,
+                    prompts,
+                    temperature=0.1,
+                    response_schema=RolePreferencesIn,
+                    tier="fast",
+                )
+                for agent_id, agent in self.agents.items()
+            }
+            batch_responses = {}
+            for agent_id, future in futures.items():
+                try:
+                    batch_responses[agent_id] = future.result()
+                except Exception as e:
+                    logger.warning("[%s] batch self-assessment failed: %s", agent_id, e)
+                    batch_responses[agent_id] = [None] * len(questions)
+
+        role_maps = []
+        for idx in range(len(questions)):
+            assessments = {}
+            for agent_id, responses in batch_responses.items():
+                raw_response = responses[idx]
+                if raw_response is None:
+                    assessments[agent_id] = self._fallback_assessment(
+                        ValueError("missing batch response")
+                    )
+                else:
+                    assessments[agent_id] = self._parse_assessment(agent_id, raw_response)
+            role_maps.append(dict(self._assign_roles(assessments)))
+
+        return role_maps
+
     def run_stage_1(self, question: str) -> Dict[str, SolverSolution]:
+        """
+        independent solution generation, sync wrapper around arun_stage_1.
+        parameters:
+            question: The problem to be solved
+        returns:
+            dictionary mapping agent IDs to their SolverSolution objects
+        """
+        return _run_sync(self.arun_stage_1(question))
+
+    async def arun_stage_1(self, question: str) -> Dict[str, SolverSolution]:
         """
         independent solution generation.
-        each solver generates their solution independently with their assigned persona
+        each solver generates their solution independently with their assigned persona;
+        the solver calls are awaited together
         parameters:
             question: The problem to be solved
         returns:
             dictionary mapping agent IDs to their SolverSolution objects
         """
-        solutions = {}
-        solver_ids = [aid for aid, role in self.role_map.items() if "Solver" in role]
+        solver_ids = self._solver_ids
 
-        for agent_id in solver_ids:
-            role_name = self.role_map[agent_id]
-            persona_instruction = self.PERSONAS.get(
-                role_name, "You are an expert reasoner."
-            )
+        results = await asyncio.gather(
+            *[self._solve(question, agent_id) for agent_id in solver_ids]
+        )
+        solutions = {
+            agent_id: solution
+            for agent_id, solution in zip(solver_ids, results)
+            if solution is not None
+        }
 
-            system_prompt = (
-                f"{persona_instruction} "
-                "solve the given problem step-by-step. "
-                "your output must be strict JSON following the schema provided."
-            )
+        self.history["stage_1_solutions"] = solutions
+        return solutions
 
-            print(f"requesting solution from {role_name}...")
-            user_prompt = f"question: {question}\n\nyou are acting as {role_name}. provide a detailed solution."
+    async def _solve(self, question: str, agent_id: str) -> Optional[SolverSolution]:
+        """
+        one solver's independent solution, None if it fails
+        """
+        role_name = self.role_map[agent_id]
+        system_prompt = self._STAGE1_SYSTEM_BY_ROLE.get(role_name, self._STAGE1_DEFAULT_SYSTEM)
 
-            agent = self.agents[agent_id]
-            raw_response = agent.generate(
+        logger.info("requesting solution from %s...", role_name)
+        user_prompt = f"question: {question}\n\nyou are acting as {role_name}. provide a detailed solution."
+
+        try:
+            raw_response = await self.agents[agent_id].agenerate(
                 system_prompt, user_prompt, response_schema=SolverSolution
             )
-
-            try:
-                solution = SolverSolution.model_validate_json(
-                    self._extract_json(raw_response)
-                )
-                solutions[agent_id] = solution
-            except Exception as e:
-                print(f"Error parsing solution from {role_name}: {e}")
-
-        self.history["stage_1_solutions"] = solutions
-        return solutions
+            return self._parse(SolverSolution, raw_response)
+        except Exception as e:
+            logger.warning("error getting solution from %s: %s", role_name, e)
+            return None
 
     def run_stage_2(
         self, question: str, solutions: Dict[str, SolverSolution]
     ) -> Dict[str, List[PeerReview]]:
         """
-        peer review
-        each solver reviews the solutions of the othes
+        peer review, sync wrapper around arun_stage_2.
         parameters:
             question: The original problem
             solutions: Dictionary of solutions from stage 1
@@ -161,50 +543,98 @@ class DebateOrchestrator:
         Returns:
             Dictionary mapping reviewer agent IDs to lists of PeerReview objects
         """
-        reviews = {}
-        solver_ids = [aid for aid, role in self.role_map.items() if "Solver" in role]
+        return _run_sync(self.arun_stage_2(question, solutions))
 
-        for reviewer_id in solver_ids:
-            reviewer_role = self.role_map[reviewer_id]
-            reviews[reviewer_id] = []
-            peers = [sid for sid in solver_ids if sid != reviewer_id]
+    async def _review(
+        self, question: str, reviewer_id: str, peer_id: str, peer_solution: SolverSolution
+    ) -> Optional[PeerReview]:
+        """
+        one reviewer's critique of one peer solution, None if it fails
+        """
+        reviewer_role = self.role_map[reviewer_id]
+        peer_role = self.role_map[peer_id]
+
+        # the reviewer's role goes in the user prompt so the system prompt is the
+        # same for every review and stays a cacheable prefix
+        system_prompt = _STAGE2_SYSTEM_PROMPT
 
-            system_prompt = (
-                f"You are {reviewer_role}. You are now acting as a Peer Reviewer. "
-                "Analyze the provided solution for logical gaps, calculation errors, or missed constraints. "
-                "Be harsh but fair. Output strict JSON."
+        logger.info("%s reviewing %s...", reviewer_role, peer_role)
+
+        user_prompt = (
+            f"You are {reviewer_role}.\n"
+            f"Original Question: {question}\n"
+            f"Solution to Review (from {peer_role}):\n"
+            f"Answer: {peer_solution.refined_answer}\n"
+            f"Reasoning: {peer_solution.reasoning}\n\n"
+            "Evaluate this solution."
+        )
+
+        try:
+            raw_response = await self.agents[reviewer_id].agenerate(
+                system_prompt, user_prompt, response_schema=PeerReview
             )
+            review = self._parse(PeerReview, raw_response)
+            review.solution_id = peer_role
+            return review
+        except Exception as e:
+            logger.warning("error getting review from %s: %s", reviewer_role, e)
+            return None
 
-            for peer_id in peers:
-                peer_role = self.role_map[peer_id]
-                peer_solution = solutions[peer_id]
-                print(f"{reviewer_role} reviewing {peer_role}...")
-
-                user_prompt = (
-                    f"Original Question: {question}\n"
-                    f"Solution to Review (from {peer_role}):\n"
-                    f"Answer: {peer_solution.refined_answer}\n"
-                    f"Reasoning: {peer_solution.reasoning}\n\n"
-                    "Evaluate this solution."
-                )
+    async def arun_stage_2(
+        self, question: str, solutions: Dict[str, SolverSolution]
+    ) -> Dict[str, List[PeerReview]]:
+        """
+        peer review
+        each solver reviews the solutions of the othes; all reviews are awaited together
+        parameters:
+            question: The original problem
+            solutions: Dictionary of solutions from stage 1
 
-                agent = self.agents[reviewer_id]
-                raw_response = agent.generate(
-                    system_prompt, user_prompt, response_schema=PeerReview
-                )
+        Returns:
+            Dictionary mapping reviewer agent IDs to lists of PeerReview objects
+        """
+        solver_ids = self._solver_ids
+        reviews = {reviewer_id: [] for reviewer_id in solver_ids}
+
+        jobs = [
+            (reviewer_id, peer_id)
+            for reviewer_id in solver_ids
+            for peer_id in solver_ids
+            if peer_id != reviewer_id
+        ]
+        results = await asyncio.gather(
+            *[
+                self._review(question, reviewer_id, peer_id, solutions[peer_id])
+                for reviewer_id, peer_id in jobs
+            ]
+        )
 
-                try:
-                    review = PeerReview.model_validate_json(
-                        self._extract_json(raw_response)
-                    )
-                    review.solution_id = peer_role
-                    reviews[reviewer_id].append(review)
-                except Exception as e:
-                    print(f"Error parsing review from {reviewer_role}: {e}")
+        # gather keeps job order, so each reviewer's list stays in peer order
+        for (reviewer_id, _), review in zip(jobs, results):
+            if review is not None:
+                reviews[reviewer_id].append(review)
 
         self.history["stage_2_reviews"] = reviews
         return reviews
 
+    def _critiques_by_target(
+        self, reviews: Dict[str, List[PeerReview]]
+    ) -> Dict[str, List[Tuple[str, PeerReview]]]:
+        """
+        index stage 2 reviews by the role they critique
+        Returns:
+            Dictionary mapping a solver role to (reviewer_role, review) pairs,
+            in the order the reviews appear in reviews
+        """
+        critiques_by_target = {}
+        for reviewer_id, review_list in reviews.items():
+            reviewer_role = self.role_map[reviewer_id]
+            for review in review_list:
+                critiques_by_target.setdefault(review.solution_id, []).append(
+                    (reviewer_role, review)
+                )
+        return critiques_by_target
+
     def run_stage_3(
         self,
         question: str,
@@ -212,8 +642,7 @@ class DebateOrchestrator:
         reviews: Dict[str, List[PeerReview]],
     ) -> Dict[str, SolverSolution]:
         """
-        solution refinement
-        each solver reviews peer feedback and refines their solution accordingly
+        solution refinement, sync wrapper around arun_stage_3.
         parameters:
             question: The original problem
             initial_solutions: Original solutions from stage 1
@@ -221,97 +650,269 @@ class DebateOrchestrator:
         Returns:
             Dictionary mapping agent IDs to refined SolverSolution objects
         """
-        refined_solutions = {}
-        solver_ids = [aid for aid, role in self.role_map.items() if "Solver" in role]
-
-        for agent_id in solver_ids:
-            role_name = self.role_map[agent_id]
-            persona_instruction = self.PERSONAS.get(role_name, "")
-
-            system_prompt = (
-                f"{persona_instruction} You are a flexible problem solver. "
-                "Review the critiques from your peers carefully. "
-                "For each critique:\n"
-                "- If it's valid, incorporate the fix into your solution\n"
-                "- If it's invalid, explain why you reject it\n\n"
-                "Output your FINAL updated solution in strict JSON format.\n"
-                "In 'changes_made', provide a list of objects with:\n"
-                "  - critique: the feedback you received\n"
-                "  - response: how you addressed it\n"
-                "  - accepted: true if you accepted it, false if you rejected it"
-            )
+        return _run_sync(self.arun_stage_3(question, initial_solutions, reviews))
 
-            print(f"\n[{role_name}] Refining solution based on peer feedback...")
+    def _refinement_prompts(
+        self,
+        question: str,
+        agent_id: str,
+        initial: SolverSolution,
+        critiques: List[Tuple[str, PeerReview]],
+    ) -> Tuple[str, str]:
+        """
+        system and user prompts asking one solver to refine its solution
+        parameters:
+            critiques: (reviewer_role, review) pairs aimed at this solver
+        """
+        role_name = self.role_map[agent_id]
+        system_prompt = self._STAGE3_SYSTEM_BY_ROLE.get(role_name, self._STAGE3_DEFAULT_SYSTEM)
+
+        logger.info("[%s] refining solution based on peer feedback...", role_name)
+
+        critique_parts = []
+        for i, (reviewer_role, c) in enumerate(critiques, 1):
+            critique_parts.append(f"\n--- Critique {i} (from {reviewer_role}) ---\n")
+            critique_parts.append(f"Overall: {c.overall_assessment}\n")
+            critique_parts.append(f"Strengths: {', '.join(c.strengths)}\n")
+            critique_parts.append(f"Weaknesses: {', '.join(c.weaknesses)}\n")
+
+            if c.errors:
+                critique_parts.append("Errors identified:\n")
+                for err in c.errors:
+                    critique_parts.append(
+                        f"  - [{err.severity}] {err.location}: {err.description}\n"
+                    )
 
-            incoming_critiques = []
-            for reviewer_id, review_list in reviews.items():
-                for review in review_list:
-                    if review.solution_id == role_name:
-                        incoming_critiques.append(review)
+            if c.suggested_changes:
+                critique_parts.append("Suggested changes:\n")
+                for change in c.suggested_changes:
+                    critique_parts.append(f"  - {change}\n")
+            critique_parts.append("\n")
 
-            critiques_text = ""
-            for i, c in enumerate(incoming_critiques, 1):
-                reviewer_role = self.role_map[
-                    [rid for rid, rlist in reviews.items() if c in rlist][0]
-                ]
-                critiques_text += f"\n--- Critique {i} (from {reviewer_role}) ---\n"
-                critiques_text += f"Overall: {c.overall_assessment}\n"
-                critiques_text += f"Strengths: {', '.join(c.strengths)}\n"
-                critiques_text += f"Weaknesses: {', '.join(c.weaknesses)}\n"
-
-                if c.errors:
-                    critiques_text += "Errors identified:\n"
-                    for err in c.errors:
-                        critiques_text += (
-                            f"  - [{err.severity}] {err.location}: {err.description}\n"
-                        )
-
-                if c.suggested_changes:
-                    critiques_text += "Suggested changes:\n"
-                    for change in c.suggested_changes:
-                        critiques_text += f"  - {change}\n"
-                critiques_text += "\n"
-
-            user_prompt = (
-                f"Original Question: {question}\n\n"
-                f"Your Original Answer: {initial_solutions[agent_id].refined_answer}\n"
-                f"Your Original Reasoning:\n{initial_solutions[agent_id].reasoning}\n\n"
-                f"{'=' * 70}\n"
-                f"PEER REVIEWS RECEIVED:\n"
-                f"{'=' * 70}\n"
-                f"{critiques_text}\n"
-                f"{'=' * 70}\n\n"
-                "Based on these reviews, provide your verified, final solution.\n"
-                "Address each significant critique explicitly in your 'changes_made' field."
+        critiques_text = "".join(critique_parts)
+
+        user_prompt = (
+            f"Original Question: {question}\n\n"
+            f"Your Original Answer: {initial.refined_answer}\n"
+            f"Your Original Reasoning:\n{initial.reasoning}\n\n"
+            f"{'=' * 70}\n"
+            f"PEER REVIEWS RECEIVED:\n"
+            f"{'=' * 70}\n"
+            f"{critiques_text}\n"
+            f"{'=' * 70}\n\n"
+            "Based on these reviews, provide your verified, final solution.\n"
+            "Address each significant critique explicitly in your 'changes_made' field."
+        )
+        return system_prompt, user_prompt
+
+    @staticmethod
+    def _needs_refinement(critiques: List[Tuple[str, PeerReview]]) -> bool:
+        # reviews without weaknesses, errors or suggested changes give the solver
+        # nothing to act on, so the refined solution would just restate the original
+        return any(c.errors or c.suggested_changes or c.weaknesses for _, c in critiques)
+
+    async def _refine(
+        self,
+        question: str,
+        agent_id: str,
+        initial: SolverSolution,
+        critiques: List[Tuple[str, PeerReview]],
+    ) -> SolverSolution:
+        """
+        one solver's refined solution; the initial one if refinement fails or
+        the critiques ask for no changes
+        """
+        if not self._needs_refinement(critiques):
+            logger.info(
+                "[%s] no actionable critiques, keeping original solution", self.role_map[agent_id]
             )
+            return initial
 
-            agent = self.agents[agent_id]
-            try:
-                raw_response = agent.generate(
-                    system_prompt,
-                    user_prompt,
-                    temperature=0.3,
-                    response_schema=SolverSolution,
-                )
+        system_prompt, user_prompt = self._refinement_prompts(
+            question, agent_id, initial, critiques
+        )
 
-                refined = SolverSolution.model_validate_json(
-                    self._extract_json(raw_response)
-                )
-                refined_solutions[agent_id] = refined
+        try:
+            raw_response = await self.agents[agent_id].agenerate(
+                system_prompt,
+                user_prompt,
+                temperature=0.3,
+                response_schema=SolverSolution,
+            )
 
-                print(f"Refined answer: {refined.refined_answer}")
-                print(f"Confidence: {refined.confidence:.2f}")
-                if refined.changes_made:
-                    print(f"Changes made: {len(refined.changes_made)}")
+            refined = self._parse(SolverSolution, raw_response)
+
+            logger.info(
+                "[%s] refined answer: %s (confidence: %.2f, changes made: %d)",
+                self.role_map[agent_id],
+                refined.refined_answer,
+                refined.confidence,
+                len(refined.changes_made or ()),
+            )
+            return refined
+
+        except Exception as e:
+            logger.warning("error refining solution of %s: %s", self.role_map[agent_id], e)
+            return initial
+
+    async def arun_stage_3(
+        self,
+        question: str,
+        initial_solutions: Dict[str, SolverSolution],
+        reviews: Dict[str, List[PeerReview]],
+    ) -> Dict[str, SolverSolution]:
+        """
+        solution refinement
+        each solver reviews peer feedback and refines their solution accordingly;
+        the refinement calls are awaited together
+        parameters:
+            question: The original problem
+            initial_solutions: Original solutions from stage 1
+            reviews: Peer reviews from stage 2
+        Returns:
+            Dictionary mapping agent IDs to refined SolverSolution objects
+        """
+        solver_ids = self._solver_ids
+        critiques_by_target = self._critiques_by_target(reviews)
+
+        requests = [
+            self._refine(
+                question,
+                agent_id,
+                initial_solutions[agent_id],
+                critiques_by_target.get(self.role_map[agent_id], []),
+            )
+            for agent_id in solver_ids
+        ]
 
-            except Exception as e:
-                print(f"Error refining solution: {e}")
-                refined_solutions[agent_id] = initial_solutions[agent_id]
+        refined_solutions = dict(zip(solver_ids, await asyncio.gather(*requests)))
 
         self.history["stage_3_refined"] = refined_solutions
-        print("=" * 70 + "\n")
+        logger.info("=" * 70)
         return refined_solutions
 
+    def _could_agree(self, solutions: List[Optional[SolverSolution]]) -> bool:
+        """
+        whether these (possibly not yet all) stage 1 solutions still allow a
+        high-confidence consensus
+        """
+        if self.consensus_confidence is None or None in solutions:
+            return False
+        answers = {_normalize_answer(s.refined_answer) for s in solutions}
+        return len(answers) <= 1 and all(
+            s.confidence >= self.consensus_confidence for s in solutions
+        )
+
+    async def arun_stages_1_to_3(self, question: str):
+        """
+        stages 1-3 scheduled as a dependency graph instead of stage by stage.
+        each solution, review and refinement is its own task: a review starts as
+        soon as the peer solution it needs is ready, and a refinement as soon as
+        the reviews of that solver are in, so one slow solver only delays the
+        work that depends on it. reviews hold back only while a high-confidence
+        consensus (see consensus_confidence) is still possible; when all solvers
+        do agree, no reviews or refinements are requested, reviews come back
+        empty and the initial solutions stand as the refined ones
+        parameters:
+            question: The problem to be solved
+        returns:
+            Tuple of (initial_solutions, reviews, refined_solutions), shaped like
+            the results of arun_stage_1, arun_stage_2 and arun_stage_3
+        """
+        solver_ids = self._solver_ids
+        review_jobs = [
+            (reviewer_id, peer_id)
+            for reviewer_id in solver_ids
+            for peer_id in solver_ids
+            if peer_id != reviewer_id
+        ]
+
+        solution_futures = {
+            agent_id: asyncio.ensure_future(self._solve(question, agent_id))
+            for agent_id in solver_ids
+        }
+
+        # resolves False as soon as one solution rules consensus out, so the
+        # pipeline only waits for every solver when they might all agree
+        consensus = asyncio.get_running_loop().create_future()
+
+        def check_consensus(_):
+            if consensus.done():
+                return
+            done = [f for f in solution_futures.values() if f.done()]
+            # a solve that failed or was cancelled leaves nothing to agree on
+            if any(f.cancelled() or f.exception() is not None for f in done):
+                consensus.set_result(False)
+                return
+            finished = [f.result() for f in done]
+            if not self._could_agree(finished):
+                consensus.set_result(False)
+            elif len(finished) == len(solution_futures):
+                consensus.set_result(True)
+
+        if self.consensus_confidence is None or not solution_futures:
+            consensus.set_result(False)
+        for future in solution_futures.values():
+            future.add_done_callback(check_consensus)
+
+        async def review_when_ready(reviewer_id: str, peer_id: str) -> Optional[PeerReview]:
+            peer_solution = await solution_futures[peer_id]
+            if peer_solution is None or await consensus:
+                return None
+            return await self._review(question, reviewer_id, peer_id, peer_solution)
+
+        review_futures = {
+            job: asyncio.ensure_future(review_when_ready(*job)) for job in review_jobs
+        }
+
+        async def refine_when_ready(agent_id: str) -> Optional[SolverSolution]:
+            initial = await solution_futures[agent_id]
+            if initial is None or await consensus:
+                return None
+            incoming = []
+            for reviewer_id, peer_id in review_jobs:
+                if peer_id == agent_id:
+                    review = await review_futures[(reviewer_id, peer_id)]
+                    if review is not None:
+                        incoming.append((self.role_map[reviewer_id], review))
+            return await self._refine(question, agent_id, initial, incoming)
+
+        try:
+            refined = await asyncio.gather(*[refine_when_ready(aid) for aid in solver_ids])
+        finally:
+            # when the debate is cancelled or a refinement fails, solves and reviews
+            # nobody waits for any more must not keep calling the providers
+            for future in (*solution_futures.values(), *review_futures.values()):
+                future.cancel()
+
+        initial_solutions = {}
+        for agent_id, future in solution_futures.items():
+            if future.result() is not None:
+                initial_solutions[agent_id] = future.result()
+
+        if consensus.result():
+            logger.info("solvers agree with high confidence, skipped peer review and refinement")
+            reviews = {}
+            refined_solutions = dict(initial_solutions)
+        else:
+            # review_jobs is in reviewer/peer order, so lists match arun_stage_2
+            reviews = {reviewer_id: [] for reviewer_id in solver_ids}
+            for (reviewer_id, _), future in review_futures.items():
+                if future.result() is not None:
+                    reviews[reviewer_id].append(future.result())
+
+            refined_solutions = {
+                agent_id: solution
+                for agent_id, solution in zip(solver_ids, refined)
+                if solution is not None
+            }
+
+        self.history["stage_1_solutions"] = initial_solutions
+        self.history["stage_2_reviews"] = reviews
+        self.history["stage_3_refined"] = refined_solutions
+        logger.info("=" * 70)
+        return initial_solutions, reviews, refined_solutions
+
     def run_stage_4(
         self,
         question: str,
@@ -330,69 +931,68 @@ class DebateOrchestrator:
         Returns
             FinalVerdict object containing the winner and reasoning
         """
-        judge_id = [aid for aid, role in self.role_map.items() if role == "Judge"][0]
-        judge_agent = self.agents[judge_id]
-
-        system_prompt = (
-            "You are the Final Judge in a multi-LLM debate system. "
-            "You will receive:\n"
-            "1. Three original solutions from independent Solvers\n"
-            "2. Peer reviews each Solver received\n"
-            "3. Three refined solutions after incorporating feedback\n\n"
-            "Your task: Select the BEST final solution based on:\n"
-            "- Logical correctness\n"
-            "- How well critiques were addressed\n"
-            "- Mathematical rigor\n"
-            "- Clarity of reasoning\n\n"
-            "Be objective and analytical. Output strict JSON."
+        return _run_sync(
+            self.arun_stage_4(question, initial_solutions, reviews, refined_solutions)
         )
 
-        context = f"ORIGINAL QUESTION:\n{question}\n\n"
-        context += "=" * 70 + "\n\n"
+    def _judge_prompts(
+        self,
+        question: str,
+        initial_solutions: Dict[str, SolverSolution],
+        reviews: Dict[str, List[PeerReview]],
+        refined_solutions: Dict[str, SolverSolution],
+    ) -> Tuple[str, str]:
+        """
+        system and user prompts for the judge, with the whole debate as context
+        """
+        system_prompt = _STAGE4_SYSTEM_PROMPT
+
+        critiques_by_target = self._critiques_by_target(reviews)
+
+        context_parts = [f"ORIGINAL QUESTION:\n{question}\n\n", "=" * 70 + "\n\n"]
 
         for agent_id in initial_solutions.keys():
             role = self.role_map[agent_id]
 
-            context += f"{'=' * 70}\n"
-            context += f"{role.upper()} - ORIGINAL SOLUTION\n"
-            context += f"{'=' * 70}\n"
+            context_parts.append(f"{'=' * 70}\n")
+            context_parts.append(f"{role.upper()} - ORIGINAL SOLUTION\n")
+            context_parts.append(f"{'=' * 70}\n")
             orig = initial_solutions[agent_id]
-            context += f"Answer: {orig.refined_answer}\n"
-            context += f"Confidence: {orig.confidence}\n"
-            context += f"Reasoning:\n{orig.reasoning}\n\n"
-
-            context += f"PEER REVIEWS RECEIVED BY {role}:\n"
-            context += "-" * 70 + "\n"
-
-            review_count = 0
-            for reviewer_id, review_list in reviews.items():
-                for review in review_list:
-                    if review.solution_id == role:
-                        reviewer_role = self.role_map[reviewer_id]
-                        review_count += 1
-                        context += f"\nReview #{review_count} (from {reviewer_role}):\n"
-                        context += f"  Overall: {review.overall_assessment}\n"
-                        context += f"  Strengths: {', '.join(review.strengths)}\n"
-                        context += f"  Weaknesses: {', '.join(review.weaknesses)}\n"
-                        if review.errors:
-                            context += f"  Errors found: {len(review.errors)}\n"
-                            for err in review.errors:
-                                context += f"    - [{err.severity}] {err.description}\n"
-
-            context += "\n"
-
-            context += f"{role.upper()} - REFINED SOLUTION\n"
+            context_parts.append(f"Answer: {orig.refined_answer}\n")
+            context_parts.append(f"Confidence: {orig.confidence}\n")
+            context_parts.append(f"Reasoning:\n{_compress_reasoning(orig.reasoning)}\n\n")
+
+            context_parts.append(f"PEER REVIEWS RECEIVED BY {role}:\n")
+            context_parts.append("-" * 70 + "\n")
+
+            # list fields go in as compact JSON rather than prose
+            for review_count, (reviewer_role, review) in enumerate(
+                critiques_by_target.get(role, []), 1
+            ):
+                context_parts.append(f"\nReview #{review_count} (from {reviewer_role}):\n")
+                context_parts.append(f"  Overall: {review.overall_assessment}\n")
+                context_parts.append(f"  Strengths: {json.dumps(review.strengths)}\n")
+                context_parts.append(f"  Weaknesses: {json.dumps(review.weaknesses)}\n")
+                if review.errors:
+                    errors = [[err.severity, err.description] for err in review.errors]
+                    context_parts.append(f"  Errors [severity, description]: {json.dumps(errors)}\n")
+
+            context_parts.append("\n")
+
+            context_parts.append(f"{role.upper()} - REFINED SOLUTION\n")
             refined = refined_solutions[agent_id]
-            context += f"Final Answer: {refined.refined_answer}\n"
-            context += f"Confidence: {refined.confidence}\n"
-            context += f"Reasoning:\n{refined.reasoning}\n"
+            context_parts.append(f"Final Answer: {refined.refined_answer}\n")
+            context_parts.append(f"Confidence: {refined.confidence}\n")
+            context_parts.append(f"Reasoning:\n{_compress_reasoning(refined.reasoning)}\n")
 
             if refined.changes_made:
-                context += "\nChanges Made:\n"
-                for change in refined.changes_made:
-                    status = "Accepted" if change.accepted else "Rejected"
-                    context += f"  [{status}] {change.critique}\n"
-                    context += f"      Response: {change.response}\n"
+                changes = [
+                    ["Accepted" if change.accepted else "Rejected", change.critique, change.response]
+                    for change in refined.changes_made
+                ]
+                context_parts.append(f"\nChanges Made [status, critique, response]: {json.dumps(changes)}\n")
+
+        context = "".join(context_parts)
 
         user_prompt = (
             f"{context}\n"
@@ -400,28 +1000,82 @@ class DebateOrchestrator:
             "Consider the quality of their original work, how they responded to critiques, "
             "and the correctness of their refined answer."
         )
+        return system_prompt, user_prompt
 
-        raw_response = judge_agent.generate(
-            system_prompt, user_prompt, temperature=0.2, response_schema=FinalVerdict
+    async def arun_stage_4(
+        self,
+        question: str,
+        initial_solutions: Dict[str, SolverSolution],
+        reviews: Dict[str, List[PeerReview]],
+        refined_solutions: Dict[str, SolverSolution],
+    ) -> FinalVerdict:
+        """
+        final judgment
+        the judge evaluates all solutions and selects the best one. the verdict
+        is streamed and the winner is announced as soon as its field arrives,
+        before the (long) reasoning has finished
+        Parameters:
+            question: The original problem
+            initial_solutions: Original solutions from stage 1
+            reviews: Peer reviews from stage 2
+            refined_solutions: Refined solutions from stage 3
+        Returns
+            FinalVerdict object containing the winner and reasoning
+        """
+        judge_agent = self.agents[self._judge_id]
+        system_prompt, user_prompt = self._judge_prompts(
+            question, initial_solutions, reviews, refined_solutions
+        )
+        # only solvers with a refined solution can win
+        verdict_schema = judge_verdict_schema(
+            tuple(sorted(self.role_map[agent_id] for agent_id in refined_solutions))
         )
 
+        chunks = []
+        head = ""
         try:
-            verdict = FinalVerdict.model_validate_json(self._extract_json(raw_response))
+            async for chunk in judge_agent.agenerate_stream(
+                system_prompt, user_prompt, temperature=0.2, response_schema=verdict_schema
+            ):
+                chunks.append(chunk)
+                if head is not None:
+                    head += chunk
+                    match = _WINNER_FIELD.search(head)
+                    if match:
+                        logger.info("[Judge] choosing %s...", match.group(1))
+                        head = None
+                    elif len(head) > _WINNER_SCAN_CHARS:
+                        head = None
+            raw_response = "".join(chunks)
+        except Exception as e:
+            # streams are not retried; the plain call goes through the agent's
+            # transient-error retry
+            logger.warning("[Judge] stream failed (%s), retrying without streaming", e)
+            raw_response = await judge_agent.agenerate(
+                system_prompt, user_prompt, temperature=0.2, response_schema=verdict_schema
+            )
 
-            winner_agent_id = None
-            for agent_id, role in self.role_map.items():
-                if role.lower() == verdict.winner.lower():
-                    winner_agent_id = agent_id
-                    break
+        return self._resolve_verdict(raw_response, verdict_schema, refined_solutions)
 
-            if winner_agent_id is None:
-                raise ValueError(
-                    f"Could not find agent for winner role: {verdict.winner}"
-                )
+    def _resolve_verdict(
+        self,
+        raw_response: str,
+        verdict_schema: type,
+        refined_solutions: Dict[str, SolverSolution],
+    ) -> FinalVerdict:
+        """
+        parse the judge's verdict and attach the winning solver's refined answer;
+        falls back to the most confident solver when it cannot be used
+        """
+        try:
+            # the schema only admits roles of refined solvers, so the winner
+            # maps straight back to its agent
+            verdict = verdict_schema.model_validate_json(self._extract_json(raw_response))
+            winner_agent_id = self.reverse_role_map[verdict.winner]
 
             winning_answer = refined_solutions[winner_agent_id].refined_answer
 
-            verdict = FinalVerdict(
+            verdict = FinalVerdict.fast_build(
                 winner=verdict.winner,
                 winning_answer=winning_answer,
                 confidence=verdict.confidence,
@@ -430,48 +1084,111 @@ class DebateOrchestrator:
 
             self.history["stage_4_verdict"] = verdict
 
-            print(f"\n{'=' * 70}")
-            print(f"VERDICT: {verdict.winner}")
-            print(f"WINNING ANSWER: {verdict.winning_answer}")
-            print(f"Confidence: {verdict.confidence:.2f}")
-            print(f"Reasoning: {verdict.reasoning}")
-            print(f"{'=' * 70}\n")
+            logger.info(
+                "VERDICT: %s, WINNING ANSWER: %s (confidence: %.2f)\nReasoning: %s",
+                verdict.winner,
+                verdict.winning_answer,
+                verdict.confidence,
+                verdict.reasoning,
+            )
 
             return verdict
 
         except Exception as e:
-            print(f"Error parsing verdict: {e}")
+            logger.warning("error parsing verdict: %s", e)
             best_solver = max(refined_solutions.items(), key=lambda x: x[1].confidence)
             role = self.role_map[best_solver[0]]
             winning_answer = best_solver[1].refined_answer
 
-            return FinalVerdict(
+            return FinalVerdict.fast_build(
                 winner=role,
                 winning_answer=winning_answer,
                 confidence=best_solver[1].confidence,
                 reasoning=f"Fallback selection: highest confidence solver after parsing error: {str(e)}",
             )
 
-    def run_full_debate(self, question: str):
+    def run_full_debate(
+        self,
+        question: str,
+        role_map: Optional[Dict[str, str]] = None,
+        category: Optional[str] = None,
+    ):
         """
+        sync wrapper around arun_full_debate
         Parameters:
             question: The problem to be solved
+            role_map: roles precomputed by batch_stage_0, skips stage 0 when given
+            category: reuse stage 0 roles across questions of the same category
         Returns:
             Tuple of (verdict, history) where verdict is the FinalVerdict and
             history contains all intermediate results from each stage
         """
-        self.history = {}
+        return _run_sync(
+            self.arun_full_debate(question, role_map=role_map, category=category)
+        )
 
-        self.run_stage_0(question)
+    async def arun_full_debate(
+        self,
+        question: str,
+        role_map: Optional[Dict[str, str]] = None,
+        category: Optional[str] = None,
+    ):
+        """
+        run every stage of the debate. plain arithmetic questions are answered
+        locally without calling any agent
+        Parameters:
+            question: The problem to be solved
+            role_map: roles precomputed by batch_stage_0, skips stage 0 when given
+            category: reuse stage 0 roles across questions of the same category
+        Returns:
+            Tuple of (verdict, history) where verdict is the FinalVerdict and
+            history contains all intermediate results from each stage
+        """
+        self.history = {}
 
-        initial_solutions = self.run_stage_1(question)
+        local_answer = _solve_locally(question)
+        if local_answer is not None:
+            verdict = FinalVerdict.fast_build(
+                winner="LocalSolver",
+                winning_answer=local_answer,
+                confidence=1.0,
+                reasoning="Resolved by the local arithmetic evaluator",
+            )
+            logger.info("answered locally: %s", local_answer)
+            self.history["stage_4_verdict"] = verdict
+            return verdict, self.history
 
-        reviews = self.run_stage_2(question, initial_solutions)
+        if role_map is None:
+            await self.arun_stage_0(question, category=category)
+        else:
+            self._use_role_map(role_map)
 
-        refined_solutions = self.run_stage_3(question, initial_solutions, reviews)
+        initial_solutions, reviews, refined_solutions = await self.arun_stages_1_to_3(
+            question
+        )
 
-        verdict = self.run_stage_4(
+        verdict = await self.arun_stage_4(
             question, initial_solutions, reviews, refined_solutions
         )
 
         return verdict, self.history
+
+    def _use_role_map(self, role_map: Dict[str, str]):
+        self.role_map = dict(role_map)
+        self.reverse_role_map = {v: k for k, v in self.role_map.items()}
+        # every stage needs these, so derive them once per role assignment
+        self._solver_ids = tuple(
+            aid for aid, role in self.role_map.items() if role.startswith("Solver_")
+        )
+        self._judge_id = next(
+            (aid for aid, role in self.role_map.items() if role == "Judge"), None
+        )
+
+    async def aclose(self):
+        """
+        close the async HTTP clients the agents own; call once when the agents
+        are no longer needed. shared clients from get_agent are closed with
+        src.aclose_clients
+        """
+        agents = {id(agent): agent for agent in self.agents.values()}
+        await asyncio.gather(*[agent.aclose() for agent in agents.values()])
@@ -1,6 +1,51 @@
-from typing import Dict
+from operator import itemgetter
+from typing import Dict, Final, List, Tuple
 from .schemas import RolePreferences
 
+# sort keys over (agent_id, confidence_judge, confidence_solver) rows
+_JUDGE_CONFIDENCE = itemgetter(1)
+# solver confidence, ties broken by judge confidence as the old judge-sorted order did
+_SOLVER_CONFIDENCE = itemgetter(2, 1)
+
+# labels for the first solvers, built once; larger panels fall back to formatting
+_SOLVER_LABELS: Final[Tuple[str, ...]] = tuple(f"Solver_{i}" for i in range(1, 17))
+
+
+def _solver_label(idx: int) -> str:
+    return _SOLVER_LABELS[idx - 1] if idx <= len(_SOLVER_LABELS) else f"Solver_{idx}"
+
+
+# panels up to this size are ranked by hand instead of through max / sorted
+_SMALL_PANEL: Final[int] = 8
+
+
+def _rank_small(rows: List[Tuple[str, float, float]]):
+    """
+    linear scan for the judge, then an in-place insertion sort of the remaining
+    rows; ties resolve exactly as in the max / sorted path
+
+    Returns
+        (judge_row, solver rows ordered best first)
+    """
+    judge_idx = 0
+    for i in range(1, len(rows)):
+        if rows[i][1] > rows[judge_idx][1]:
+            judge_idx = i
+    judge_row = rows.pop(judge_idx)
+
+    # shift only past strictly lower keys so equal rows keep their input order
+    for i in range(1, len(rows)):
+        row = rows[i]
+        key = (row[2], row[1])
+        j = i - 1
+        while j >= 0 and (rows[j][2], rows[j][1]) < key:
+            rows[j + 1] = rows[j]
+            j -= 1
+        rows[j + 1] = row
+
+    return judge_row, rows
+
+
 class RoleManager:
     @staticmethod
     def assign_roles(assessments: Dict[str, RolePreferences]) -> Dict[str, str]:
@@ -13,25 +58,32 @@ class RoleManager:
         Returns
             Dict mapping agent_id to role_name
         """
-        sorted_for_judge = sorted(
-            assessments.items(), 
-            key=lambda x: x[1].confidence_judge, 
-            reverse=True
-        )
-        
-        assignments = {}
-        
-        judge_id = sorted_for_judge[0][0]
-        assignments[judge_id] = "Judge"
-        
-        remaining = sorted_for_judge[1:]
-        remaining_sorted = sorted(
-            remaining,
-            key=lambda x: x[1].confidence_solver,
-            reverse=True
-        )
-    
-        for idx, (agent_id, _) in enumerate(remaining_sorted, start=1):
-            assignments[agent_id] = f"Solver_{idx}"
-            
-        return assignments
\ No newline at end of file
+        # read both confidences once up front so the sorts key on itemgetter
+        # instead of calling a lambda per element
+        rows = [
+            (agent_id, prefs.confidence_judge, prefs.confidence_solver)
+            for agent_id, prefs in assessments.items()
+        ]
+
+        if len(rows) <= _SMALL_PANEL:
+            judge_row, solvers_sorted = _rank_small(rows)
+        else:
+            # only the top judge confidence matters, so no full sort is needed;
+            # max keeps the first of equal candidates, as the stable sort did
+            judge_row = max(rows, key=_JUDGE_CONFIDENCE)
+
+            # a single sort orders the solvers
+            solvers_sorted = sorted(
+                (row for row in rows if row is not judge_row),
+                key=_SOLVER_CONFIDENCE,
+                reverse=True,
+            )
+
+        # one dict build labels everyone
+        return {
+            judge_row[0]: "Judge",
+            **{
+                agent_id: _solver_label(idx)
+                for idx, (agent_id, _, _) in enumerate(solvers_sorted, start=1)
+            },
+        }
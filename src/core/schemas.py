@@ -1,5 +1,7 @@
-from typing import List, Dict, Optional
-from pydantic import BaseModel, Field, ConfigDict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Dict, Literal, Optional, Tuple
+from pydantic import BaseModel, Field, ConfigDict, create_model
 
 
 
@@ -20,7 +22,11 @@ class ChangeRecord(BaseModel):
     )
 
 
-class RolePreferences(BaseModel):
+class RolePreferencesIn(BaseModel):
+    """
+    stage 0 self-assessment as the model returns it; only used to validate the
+    response, which is then converted to RolePreferences
+    """
     model_config = ConfigDict(extra='forbid')
     
     role_preferences: List[str] = Field(
@@ -46,7 +52,30 @@ class RolePreferences(BaseModel):
         ..., 
         description="Explanation of why these roles match the model's strengths for this specific question."
     )
-    
+
+
+@dataclass(slots=True, frozen=True)
+class RolePreferences:
+    """
+    validated self-assessment as it is passed around inside the orchestrator;
+    a slotted dataclass is cheaper to build and read than the pydantic model
+    """
+    role_preferences: Tuple[str, ...]
+    confidence_solver: float
+    confidence_judge: float
+    reasoning: str
+
+    @classmethod
+    def from_model(cls, parsed: RolePreferencesIn) -> "RolePreferences":
+        return cls(
+            role_preferences=tuple(parsed.role_preferences),
+            confidence_solver=parsed.confidence_solver,
+            confidence_judge=parsed.confidence_judge,
+            reasoning=parsed.reasoning,
+        )
+
+    # role assignment keys on confidence_judge / confidence_solver directly and
+    # never goes through this dict
     @property
     def confidence_by_role(self) -> Dict[str, float]:
         return {
@@ -164,4 +193,51 @@ class FinalVerdict(BaseModel):
     reasoning: str = Field(
         ..., 
         description="Explanation of why this solver was chosen over the others."
+    )
+
+    @classmethod
+    def fast_build(cls, **fields) -> "FinalVerdict":
+        """
+        build from values that are already valid (internal data, not raw LLM
+        output) without running the field validators
+        """
+        return cls.model_construct(**fields)
+
+
+@lru_cache(maxsize=8)
+def judge_verdict_schema(solver_roles: Tuple[str, ...]) -> type:
+    """
+    FinalVerdict whose winner is restricted to the given solver roles, so a
+    provider with constrained decoding can only name a solver that exists
+    """
+    return create_model(
+        "JudgeVerdict",
+        __base__=FinalVerdict,
+        winner=(
+            Literal[solver_roles],
+            Field(..., description="The ID of the solver with the best solution."),
+        ),
+    )
+
+
+class GradingItem(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
+    id: str = Field(
+        ..., 
+        description="The id of the graded item, copied from the input."
+    )
+    
+    verdict: Literal["YES", "NO"] = Field(
+        ...,
+        description="YES if the system answer is equivalent to the ground truth, otherwise NO."
+    )
+
+
+class GradingBatch(BaseModel):
+    model_config = ConfigDict(extra='forbid')
+    
+    results: List[GradingItem] = Field(
+        ...,
+        description="One grading result per input item."
     )
\ No newline at end of file